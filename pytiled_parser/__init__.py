@@ -14,8 +14,8 @@ PyTiled Parser is not tied to any particular graphics library or game engine.
 from .common_types import Color, OrderedPair, Size
 from .exception import UnknownFormat
 from .layer import Chunk, ImageLayer, Layer, LayerGroup, ObjectLayer, TileLayer
-from .parser import parse_map, parse_world, parse_tileset
+from .parser import parse_map, parse_map_header, parse_tileset, parse_world
 from .properties import Properties, Property
-from .tiled_map import TiledMap
+from .tiled_map import MapHeader, TiledMap
 from .tileset import Frame, Grid, Tile, Tileset, Transformations
 from .world import World, WorldMap
@@ -1,15 +1,18 @@
 import json
-import xml.etree.ElementTree as etree
 from pathlib import Path
 
 from pytiled_parser import UnknownFormat
 from pytiled_parser.parsers.json.tiled_map import parse as json_map_parse
+from pytiled_parser.parsers.json.tiled_map import (
+    parse_header as json_map_header_parse,
+)
 from pytiled_parser.parsers.json.tileset import parse as json_tileset_parse
 from pytiled_parser.parsers.tmx.tiled_map import parse as tmx_map_parse
+from pytiled_parser.parsers.tmx.tiled_map import parse_header as tmx_map_header_parse
 from pytiled_parser.parsers.tmx.tileset import parse as tmx_tileset_parse
-from pytiled_parser.tiled_map import TiledMap
+from pytiled_parser.tiled_map import MapHeader, TiledMap
 from pytiled_parser.tileset import Tileset
-from pytiled_parser.util import check_format
+from pytiled_parser.util import check_format, load_xml
 from pytiled_parser.world import World
 from pytiled_parser.world import parse_world as _parse_world
 
@@ -38,6 +41,32 @@ def parse_map(file: Path) -> TiledMap:
             )
 
 
+def parse_map_header(file: Path) -> MapHeader:
+    """Parse only the basic attributes and properties of a Tiled map
+
+    This skips all of the tilesets and layers of the map, so is much faster than
+    `parse_map` when only these details are needed.
+
+    Args:
+        file: Path to the map file
+
+    Returns:
+        MapHeader: The parsed header of the map
+    """
+    parser = check_format(file)
+
+    if parser == "tmx":
+        return tmx_map_header_parse(file)
+    else:
+        try:
+            return json_map_header_parse(file)
+        except ValueError:
+            raise UnknownFormat(
+                "Unknown Map Format, please use either the TMX or JSON format. "
+                "This message could also mean your map file is invalid or corrupted."
+            )
+
+
 def parse_tileset(file: Path) -> Tileset:
     """Parse the raw Tiled Tileset into a pytiled_parser type
 
@@ -50,8 +79,7 @@ def parse_tileset(file: Path) -> Tileset:
     parser = check_format(file)
 
     if parser == "tmx":
-        with open(file) as map_file:
-            raw_tileset = etree.parse(map_file).getroot()
+        raw_tileset = load_xml(file)
         return tmx_tileset_parse(raw_tileset, 1)
     else:
         try:
@@ -0,0 +1,43 @@
+"""External tileset loading shared by the TMX and JSON map parsers."""
+import json
+from pathlib import Path
+
+from pytiled_parser.exception import UnknownFormat
+from pytiled_parser.parsers.json.tileset import parse as parse_json_tileset
+from pytiled_parser.parsers.tmx.tileset import parse as parse_tmx_tileset
+from pytiled_parser.tileset import Tileset
+from pytiled_parser.util import check_format, load_xml
+
+
+def load_external_tileset(tileset_path: Path, firstgid: int) -> Tileset:
+    """Load an external tileset file referenced by a map, in either format.
+
+    Args:
+        tileset_path: Path to the tileset file.
+        firstgid: GID corresponding the first tile in the set for this map.
+
+    Returns:
+        Tileset: The parsed Tileset.
+
+    Raises:
+        UnknownFormat: If the tileset file is not a valid TSX or JSON file.
+    """
+    if check_format(tileset_path) == "tmx":
+        return parse_tmx_tileset(
+            load_xml(tileset_path),
+            firstgid,
+            external_path=tileset_path.parent,
+        )
+
+    with open(tileset_path) as tileset_file:
+        try:
+            return parse_json_tileset(
+                json.load(tileset_file),
+                firstgid,
+                external_path=tileset_path.parent,
+            )
+        except ValueError:
+            raise UnknownFormat(
+                "Unknown Tileset Format, please use either the TSX or JSON format. "
+                "This message could also mean your tileset file is invalid or corrupted."
+            )
@@ -3,13 +3,15 @@
 import base64
 import gzip
 import importlib.util
+import struct
+import sys
 import zlib
 from pathlib import Path
-from typing import Any, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 from typing_extensions import TypedDict
 
-from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.common_types import OrderedPair
 from pytiled_parser.layer import (
     Chunk,
     ImageLayer,
@@ -22,7 +24,7 @@ from pytiled_parser.parsers.json.properties import RawProperty
 from pytiled_parser.parsers.json.properties import parse as parse_properties
 from pytiled_parser.parsers.json.tiled_object import RawObject
 from pytiled_parser.parsers.json.tiled_object import parse as parse_object
-from pytiled_parser.util import parse_color
+from pytiled_parser.util import cached_ordered_pair, cached_size, parse_color
 
 # This optional zstd include is basically impossible to make a sensible test
 # for both ways. It's been tested manually, is unlikely to change or be effected
@@ -39,6 +41,26 @@ if zstd_spec:  # pragma: no cover
 else:
     zstd = None
 
+# pybase64 is an optional SIMD accelerated drop-in for the standard library's base64
+# decoding. Like zstd above, only the fallback is exercised by the test suite.
+pybase64_spec = importlib.util.find_spec("pybase64")
+if pybase64_spec:  # pragma: no cover
+    from pybase64 import b64decode
+else:
+    b64decode = base64.b64decode
+
+# python-isal provides zlib and gzip compatible modules backed by Intel's ISA-L, which
+# inflate data considerably faster than the standard library. As with the other
+# optional accelerators, only the standard library fallback is exercised by the test
+# suite.
+isal_spec = importlib.util.find_spec("isal")
+if isal_spec:  # pragma: no cover
+    from isal import isal_zlib as zlib_backend
+    from isal.igzip import decompress as gzip_decompress
+else:
+    zlib_backend = zlib
+    gzip_decompress = gzip.decompress
+
 
 RawChunk = TypedDict(
     "RawChunk",
@@ -102,18 +124,15 @@ def _convert_raw_tile_layer_data(data: List[int], layer_width: int) -> List[List
     Returns:
         List[List[int]]: A nested list containing the converted data
     """
-    tile_grid: List[List[int]] = [[]]
+    if not data:
+        return [[]]
 
-    column_count = 0
-    row_count = 0
-    for item in data:
-        column_count += 1
-        tile_grid[row_count].append(item)
-        if not column_count % layer_width and column_count < len(data):
-            row_count += 1
-            tile_grid.append([])
-
-    return tile_grid
+    # The number of rows is known up front, so each row is sliced out whole instead
+    # of appending to it one tile at a time.
+    return [
+        data[row_start : row_start + layer_width]
+        for row_start in range(0, len(data), layer_width)
+    ]
 
 
 def _decode_tile_layer_data(
@@ -131,11 +150,13 @@ def _decode_tile_layer_data(
     Raises:
         ValueError: For an unsupported compression type.
     """
-    unencoded_data = base64.b64decode(data)
+    unencoded_data = b64decode(data.strip(), validate=False)
     if compression == "zlib":
-        unzipped_data = zlib.decompress(unencoded_data)
+        unzipped_data = zlib_backend.decompress(unencoded_data)
     elif compression == "gzip":
-        unzipped_data = gzip.decompress(unencoded_data)
+        # gzip.decompress reads every member of a multi-member stream, where a single
+        # zlib.decompress call would silently stop after the first one.
+        unzipped_data = gzip_decompress(unencoded_data)
     elif compression == "zstd" and zstd is None:
         raise ValueError(
             "zstd compression support is not installed."
@@ -147,19 +168,22 @@ def _decode_tile_layer_data(
     else:
         unzipped_data = unencoded_data
 
-    tile_grid: List[int] = []
+    # The data is a sequence of little-endian unsigned 32-bit integers, so it can be
+    # viewed directly as such rather than assembling each integer byte by byte. The
+    # memoryview doesn't copy the data, it is only read once by tolist().
+    # Any trailing bytes which don't make up a full integer are ignored.
+    tile_count = len(unzipped_data) // 4
+    if sys.byteorder == "little":
+        tile_grid: List[int] = (
+            memoryview(unzipped_data)[: tile_count * 4].cast("I").tolist()
+        )
+    else:  # pragma: no cover
+        # The native int format doesn't match, so unpack with an explicit byte order
+        tile_grid = list(struct.unpack_from(f"<{tile_count}I", unzipped_data))
 
-    byte_count = 0
-    int_count = 0
-    int_value = 0
-    for byte in unzipped_data:
-        int_value += byte << (byte_count * 8)
-        byte_count += 1
-        if not byte_count % 4:
-            byte_count = 0
-            int_count += 1
-            tile_grid.append(int_value)
-            int_value = 0
+    # The byte buffers aren't needed once the ids have been read, so drop them before
+    # building the rows rather than holding them until the function returns.
+    del unencoded_data, unzipped_data
 
     return _convert_raw_tile_layer_data(tile_grid, layer_width)
 
@@ -192,50 +216,53 @@ def _parse_chunk(
 
     chunk = Chunk(
         coordinates=OrderedPair(raw_chunk["x"], raw_chunk["y"]),
-        size=Size(raw_chunk["width"], raw_chunk["height"]),
+        size=cached_size(raw_chunk["width"], raw_chunk["height"]),
         data=data,
     )
 
     return chunk
 
 
-def _parse_common(raw_layer: RawLayer) -> Layer:
-    """Create a Layer containing all the attributes common to all layer types.
+def _parse_common(raw_layer: RawLayer) -> Dict[str, Any]:
+    """Parse the attributes common to all layer types.
 
-    This is to create the stub Layer object that can then be used to create the actual
-        specific sub-classes of Layer.
+    These are returned as keyword arguments which can be passed straight into the
+        constructor of the specific sub-class of Layer, rather than building a stub
+        Layer object just to copy its attributes over.
 
     Args:
         raw_layer: Raw layer get common attributes from
 
     Returns:
-        Layer: The attributes in common of all layer types
+        Dict[str, Any]: The attributes in common of all layer types
     """
-    common = Layer(
-        name=raw_layer["name"],
-        opacity=raw_layer["opacity"],
-        visible=raw_layer["visible"],
-    )
+    common: Dict[str, Any] = {
+        "name": raw_layer["name"],
+        "opacity": raw_layer["opacity"],
+        "visible": raw_layer["visible"],
+    }
 
     # if startx is present, starty is present
     if raw_layer.get("startx") is not None:
-        common.coordinates = OrderedPair(raw_layer["startx"], raw_layer["starty"])
+        common["coordinates"] = OrderedPair(raw_layer["startx"], raw_layer["starty"])
 
     if raw_layer.get("id") is not None:
-        common.id = raw_layer["id"]
+        common["id"] = raw_layer["id"]
 
     # if either width or height is present, they both are
     if raw_layer.get("width") is not None:
-        common.size = Size(raw_layer["width"], raw_layer["height"])
+        common["size"] = cached_size(raw_layer["width"], raw_layer["height"])
 
     if raw_layer.get("offsetx") is not None:
-        common.offset = OrderedPair(raw_layer["offsetx"], raw_layer["offsety"])
+        common["offset"] = cached_ordered_pair(
+            raw_layer["offsetx"], raw_layer["offsety"]
+        )
 
     if raw_layer.get("properties") is not None:
-        common.properties = parse_properties(raw_layer["properties"])
+        common["properties"] = parse_properties(raw_layer["properties"])
 
     if raw_layer.get("class") is not None:
-        common.class_ = raw_layer["class"]
+        common["class_"] = raw_layer["class"]
 
     parallax = [1.0, 1.0]
 
@@ -245,16 +272,16 @@ def _parse_common(raw_layer: RawLayer) -> Layer:
     if raw_layer.get("parallaxy") is not None:
         parallax[1] = raw_layer["parallaxy"]
 
-    common.parallax_factor = OrderedPair(parallax[0], parallax[1])
+    common["parallax_factor"] = cached_ordered_pair(parallax[0], parallax[1])
 
     if raw_layer.get("tintcolor") is not None:
-        common.tint_color = parse_color(raw_layer["tintcolor"])
+        common["tint_color"] = parse_color(raw_layer["tintcolor"])
 
     if raw_layer.get("repeatx") is not None:
-        common.repeat_x = raw_layer["repeatx"]
+        common["repeat_x"] = raw_layer["repeatx"]
 
     if raw_layer.get("repeaty") is not None:
-        common.repeat_y = raw_layer["repeaty"]
+        common["repeat_y"] = raw_layer["repeaty"]
 
     return common
 
@@ -268,17 +295,15 @@ def _parse_tile_layer(raw_layer: RawLayer) -> TileLayer:
     Returns:
         TileLayer: The TileLayer created from raw_layer
     """
-    tile_layer = TileLayer(**_parse_common(raw_layer).__dict__)
+    tile_layer = TileLayer(**_parse_common(raw_layer))
 
     if raw_layer.get("chunks") is not None:
-        tile_layer.chunks = []
-        for chunk in raw_layer["chunks"]:
-            if raw_layer.get("encoding") is not None:
-                tile_layer.chunks.append(
-                    _parse_chunk(chunk, raw_layer["encoding"], raw_layer["compression"])
-                )
-            else:
-                tile_layer.chunks.append(_parse_chunk(chunk))
+        # The encoding is the same for every chunk, so look it up once
+        encoding = raw_layer.get("encoding")
+        compression = raw_layer["compression"] if encoding is not None else None
+        tile_layer.chunks = [
+            _parse_chunk(chunk, encoding, compression) for chunk in raw_layer["chunks"]
+        ]
 
     if raw_layer.get("data") is not None:
         if raw_layer.get("encoding") is not None:
@@ -307,14 +332,12 @@ def _parse_object_layer(
     Returns:
         ObjectLayer: The ObjectLayer created from raw_layer
     """
-    objects = []
-    for object_ in raw_layer["objects"]:
-        objects.append(parse_object(object_, parent_dir))
+    objects = [parse_object(object_, parent_dir) for object_ in raw_layer["objects"]]
 
     return ObjectLayer(
         tiled_objects=objects,
         draw_order=raw_layer["draworder"],
-        **_parse_common(raw_layer).__dict__,
+        **_parse_common(raw_layer),
     )
 
 
@@ -327,9 +350,7 @@ def _parse_image_layer(raw_layer: RawLayer) -> ImageLayer:
     Returns:
         ImageLayer: The ImageLayer created from raw_layer
     """
-    image_layer = ImageLayer(
-        image=Path(raw_layer["image"]), **_parse_common(raw_layer).__dict__
-    )
+    image_layer = ImageLayer(image=Path(raw_layer["image"]), **_parse_common(raw_layer))
 
     if raw_layer.get("transparentcolor") is not None:
         image_layer.transparent_color = parse_color(raw_layer["transparentcolor"])
@@ -353,7 +374,15 @@ def _parse_group_layer(
     for layer in raw_layer["layers"]:
         layers.append(parse(layer, parent_dir=parent_dir))
 
-    return LayerGroup(layers=layers, **_parse_common(raw_layer).__dict__)
+    return LayerGroup(layers=layers, **_parse_common(raw_layer))
+
+
+_LAYER_PARSERS: Dict[str, Callable[[RawLayer, Optional[Path]], Layer]] = {
+    "objectgroup": _parse_object_layer,
+    "group": _parse_group_layer,
+    "imagelayer": lambda raw_layer, parent_dir: _parse_image_layer(raw_layer),
+    "tilelayer": lambda raw_layer, parent_dir: _parse_tile_layer(raw_layer),
+}
 
 
 def parse(
@@ -376,13 +405,8 @@ def parse(
     """
     type_ = raw_layer["type"]
 
-    if type_ == "objectgroup":
-        return _parse_object_layer(raw_layer, parent_dir)
-    elif type_ == "group":
-        return _parse_group_layer(raw_layer, parent_dir)
-    elif type_ == "imagelayer":
-        return _parse_image_layer(raw_layer)
-    elif type_ == "tilelayer":
-        return _parse_tile_layer(raw_layer)
+    layer_parser = _LAYER_PARSERS.get(type_)
+    if layer_parser is None:
+        raise RuntimeError(f"An invalid layer type of {type_} was supplied")
 
-    raise RuntimeError(f"An invalid layer type of {type_} was supplied")
+    return layer_parser(raw_layer, parent_dir)
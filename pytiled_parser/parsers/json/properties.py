@@ -2,7 +2,7 @@
 """
 
 from pathlib import Path
-from typing import List, Union, cast
+from typing import Callable, Dict, List, Union, cast
 
 from typing_extensions import TypedDict
 
@@ -11,6 +11,13 @@ from pytiled_parser.util import parse_color
 
 RawValue = Union[float, str, bool]
 
+# Converters for the property types which JSON can't represent natively. Every other
+# type is already stored with the right value.
+_PROPERTY_PARSERS: Dict[str, Callable[[str], Property]] = {
+    "file": Path,
+    "color": parse_color,
+}
+
 
 class RawProperty(TypedDict):
     """The keys and their values that appear in a Tiled JSON Property Object.
@@ -41,12 +48,10 @@ def parse(raw_properties: List[RawProperty]) -> Properties:
             final[name] = value
     else:
         for raw_property in raw_properties:
-            if raw_property["type"] == "file":
-                value = Path(cast(str, raw_property["value"]))
-            elif raw_property["type"] == "color":
-                value = parse_color(cast(str, raw_property["value"]))
-            else:
-                value = raw_property["value"]
+            value = raw_property["value"]
+            property_parser = _PROPERTY_PARSERS.get(raw_property["type"])
+            if property_parser is not None:
+                value = property_parser(cast(str, value))
             final[raw_property["name"]] = value
 
     return final
@@ -1,21 +1,19 @@
 import json
-import xml.etree.ElementTree as etree
 from pathlib import Path
 from typing import List, Union, cast
 
 from typing_extensions import TypedDict
 
 from pytiled_parser.common_types import OrderedPair, Size
-from pytiled_parser.exception import UnknownFormat
+from pytiled_parser.parsers.external_tileset import load_external_tileset
 from pytiled_parser.parsers.json.layer import RawLayer
 from pytiled_parser.parsers.json.layer import parse as parse_layer
 from pytiled_parser.parsers.json.properties import RawProperty
 from pytiled_parser.parsers.json.properties import parse as parse_properties
 from pytiled_parser.parsers.json.tileset import RawTileSet
 from pytiled_parser.parsers.json.tileset import parse as parse_json_tileset
-from pytiled_parser.parsers.tmx.tileset import parse as parse_tmx_tileset
-from pytiled_parser.tiled_map import TiledMap, TilesetDict
-from pytiled_parser.util import check_format, parse_color
+from pytiled_parser.tiled_map import MapHeader, TiledMap, TilesetDict
+from pytiled_parser.util import parse_color
 
 RawTilesetMapping = TypedDict("RawTilesetMapping", {"firstgid": int, "source": str})
 
@@ -55,6 +53,42 @@ RawTiledMap.__doc__ = """
 """
 
 
+def parse_header(file: Path) -> MapHeader:
+    """Parse only the attributes and properties of a Tiled map.
+
+    The whole file still has to be decoded as JSON, but none of its tilesets or
+    layers are parsed.
+
+    Args:
+        file: Path to the map file.
+
+    Returns:
+        MapHeader: The parsed MapHeader.
+    """
+    with open(file) as map_file:
+        raw_tiled_map = json.load(map_file)
+
+    header = MapHeader(
+        map_file=file,
+        infinite=raw_tiled_map.get("infinite", False),
+        map_size=Size(raw_tiled_map["width"], raw_tiled_map["height"]),
+        orientation=raw_tiled_map["orientation"],
+        render_order=raw_tiled_map["renderorder"],
+        tile_size=Size(raw_tiled_map["tilewidth"], raw_tiled_map["tileheight"]),
+    )
+
+    if raw_tiled_map.get("class") is not None:
+        header.class_ = raw_tiled_map["class"]
+
+    if raw_tiled_map.get("backgroundcolor") is not None:
+        header.background_color = parse_color(raw_tiled_map["backgroundcolor"])
+
+    if raw_tiled_map.get("properties") is not None:
+        header.properties = parse_properties(raw_tiled_map["properties"])
+
+    return header
+
+
 def parse(file: Path) -> TiledMap:
     """Parse the raw Tiled map into a pytiled_parser type.
 
@@ -75,28 +109,9 @@ def parse(file: Path) -> TiledMap:
     for raw_tileset in raw_tilesets:
         if raw_tileset.get("source") is not None:
             # Is an external Tileset
-            tileset_path = Path(parent_dir / raw_tileset["source"])
-            parser = check_format(tileset_path)
-            with open(tileset_path) as raw_tileset_file:
-                if parser == "tmx":
-                    raw_tileset_external = etree.parse(raw_tileset_file).getroot()
-                    tilesets[raw_tileset["firstgid"]] = parse_tmx_tileset(
-                        raw_tileset_external,
-                        raw_tileset["firstgid"],
-                        external_path=tileset_path.parent,
-                    )
-                else:
-                    try:
-                        tilesets[raw_tileset["firstgid"]] = parse_json_tileset(
-                            json.load(raw_tileset_file),
-                            raw_tileset["firstgid"],
-                            external_path=tileset_path.parent,
-                        )
-                    except ValueError:
-                        raise UnknownFormat(
-                            "Unknown Tileset Format, please use either the TSX or JSON format. "
-                            "This message could also mean your tileset file is invalid or corrupted."
-                        )
+            tilesets[raw_tileset["firstgid"]] = load_external_tileset(
+                Path(parent_dir / raw_tileset["source"]), raw_tileset["firstgid"]
+            )
         else:
             # Is an embedded Tileset
             raw_tileset = cast(RawTileSet, raw_tileset)
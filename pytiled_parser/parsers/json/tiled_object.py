@@ -1,11 +1,12 @@
 """Object parsing for the JSON Map Format.
 """
+import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from typing_extensions import TypedDict
 
-from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.common_types import OrderedPair
 from pytiled_parser.parsers.json.properties import RawProperty
 from pytiled_parser.parsers.json.properties import parse as parse_properties
 from pytiled_parser.tiled_object import (
@@ -18,7 +19,12 @@ from pytiled_parser.tiled_object import (
     Tile,
     TiledObject,
 )
-from pytiled_parser.util import load_object_template, parse_color
+from pytiled_parser.util import (
+    cached_ordered_pair,
+    cached_size,
+    load_object_template,
+    parse_color,
+)
 
 RawText = TypedDict(
     "RawText",
@@ -74,33 +80,41 @@ RawObject.__doc__ = """
 """
 
 
-def _parse_common(raw_object: RawObject) -> TiledObject:
-    """Create an Object containing all the attributes common to all types of objects.
+def _parse_common(raw_object: RawObject) -> Dict[str, Any]:
+    """Parse the attributes common to all types of objects.
+
+    These are returned as keyword arguments which can be passed straight into the
+        constructor of the specific sub-class of TiledObject.
 
     Args:
         raw_object: Raw object to get common attributes from
 
     Returns:
-        Object: The attributes in common of all types of objects
+        Dict[str, Any]: The attributes in common of all types of objects
     """
 
-    common = TiledObject(
-        id=raw_object["id"],
-        coordinates=OrderedPair(raw_object["x"], raw_object["y"]),
-        visible=raw_object["visible"],
-        size=Size(raw_object["width"], raw_object["height"]),
-        rotation=raw_object["rotation"],
-        name=raw_object["name"],
-    )
-
-    if raw_object.get("type") is not None:
-        common.class_ = raw_object["type"]
-
-    if raw_object.get("class") is not None:
-        common.class_ = raw_object["class"]
-
-    if raw_object.get("properties") is not None:
-        common.properties = parse_properties(raw_object["properties"])
+    # Object names and classes repeat across a map, so they are interned to share one
+    # string per distinct value rather than one per object.
+    common: Dict[str, Any] = {
+        "id": raw_object["id"],
+        "coordinates": cached_ordered_pair(raw_object["x"], raw_object["y"]),
+        "visible": raw_object["visible"],
+        "size": cached_size(raw_object["width"], raw_object["height"]),
+        "rotation": raw_object["rotation"],
+        "name": sys.intern(raw_object["name"]),
+    }
+
+    type_ = raw_object.get("type")
+    if type_ is not None:
+        common["class_"] = sys.intern(type_)
+
+    class_ = raw_object.get("class")
+    if class_ is not None:
+        common["class_"] = sys.intern(class_)
+
+    properties = raw_object.get("properties")
+    if properties is not None:
+        common["properties"] = parse_properties(properties)
 
     return common
 
@@ -114,7 +128,7 @@ def _parse_ellipse(raw_object: RawObject) -> Ellipse:
     Returns:
         Ellipse: The Ellipse object created from the raw object
     """
-    return Ellipse(**_parse_common(raw_object).__dict__)
+    return Ellipse(**_parse_common(raw_object))
 
 
 def _parse_rectangle(raw_object: RawObject) -> Rectangle:
@@ -126,7 +140,7 @@ def _parse_rectangle(raw_object: RawObject) -> Rectangle:
     Returns:
         Rectangle: The Rectangle object created from the raw object
     """
-    return Rectangle(**_parse_common(raw_object).__dict__)
+    return Rectangle(**_parse_common(raw_object))
 
 
 def _parse_point(raw_object: RawObject) -> Point:
@@ -138,7 +152,7 @@ def _parse_point(raw_object: RawObject) -> Point:
     Returns:
         Point: The Point object created from the raw object
     """
-    return Point(**_parse_common(raw_object).__dict__)
+    return Point(**_parse_common(raw_object))
 
 
 def _parse_polygon(raw_object: RawObject) -> Polygon:
@@ -150,11 +164,9 @@ def _parse_polygon(raw_object: RawObject) -> Polygon:
     Returns:
         Polygon: The Polygon object created from the raw object
     """
-    polygon = []
-    for point in raw_object["polygon"]:
-        polygon.append(OrderedPair(point["x"], point["y"]))
+    polygon = [OrderedPair(point["x"], point["y"]) for point in raw_object["polygon"]]
 
-    return Polygon(points=polygon, **_parse_common(raw_object).__dict__)
+    return Polygon(points=polygon, **_parse_common(raw_object))
 
 
 def _parse_polyline(raw_object: RawObject) -> Polyline:
@@ -166,11 +178,9 @@ def _parse_polyline(raw_object: RawObject) -> Polyline:
     Returns:
         Polyline: The Polyline object created from the raw object
     """
-    polyline = []
-    for point in raw_object["polyline"]:
-        polyline.append(OrderedPair(point["x"], point["y"]))
+    polyline = [OrderedPair(point["x"], point["y"]) for point in raw_object["polyline"]]
 
-    return Polyline(points=polyline, **_parse_common(raw_object).__dict__)
+    return Polyline(points=polyline, **_parse_common(raw_object))
 
 
 def _parse_tile(
@@ -192,7 +202,7 @@ def _parse_tile(
         gid=gid,
         new_tileset=new_tileset,
         new_tileset_path=new_tileset_path,
-        **_parse_common(raw_object).__dict__,
+        **_parse_common(raw_object),
     )
 
 
@@ -210,45 +220,68 @@ def _parse_text(raw_object: RawObject) -> Text:
     text = raw_text["text"]
 
     # create base Text object
-    text_object = Text(text=text, **_parse_common(raw_object).__dict__)
+    text_object = Text(text=text, **_parse_common(raw_object))
 
     # optional attributes
-    if raw_text.get("color") is not None:
-        text_object.color = parse_color(raw_text["color"])
+    color = raw_text.get("color")
+    if color is not None:
+        text_object.color = parse_color(color)
 
-    if raw_text.get("fontfamily") is not None:
-        text_object.font_family = raw_text["fontfamily"]
+    font_family = raw_text.get("fontfamily")
+    if font_family is not None:
+        text_object.font_family = font_family
 
-    if raw_text.get("pixelsize") is not None:
-        text_object.font_size = raw_text["pixelsize"]
+    font_size = raw_text.get("pixelsize")
+    if font_size is not None:
+        text_object.font_size = font_size
 
-    if raw_text.get("bold") is not None:
-        text_object.bold = raw_text["bold"]
+    bold = raw_text.get("bold")
+    if bold is not None:
+        text_object.bold = bold
 
-    if raw_text.get("italic") is not None:
-        text_object.italic = raw_text["italic"]
+    italic = raw_text.get("italic")
+    if italic is not None:
+        text_object.italic = italic
 
-    if raw_text.get("kerning") is not None:
-        text_object.kerning = raw_text["kerning"]
+    kerning = raw_text.get("kerning")
+    if kerning is not None:
+        text_object.kerning = kerning
 
-    if raw_text.get("strikeout") is not None:
-        text_object.strike_out = raw_text["strikeout"]
+    strike_out = raw_text.get("strikeout")
+    if strike_out is not None:
+        text_object.strike_out = strike_out
 
-    if raw_text.get("underline") is not None:
-        text_object.underline = raw_text["underline"]
+    underline = raw_text.get("underline")
+    if underline is not None:
+        text_object.underline = underline
 
-    if raw_text.get("halign") is not None:
-        text_object.horizontal_align = raw_text["halign"]
+    horizontal_align = raw_text.get("halign")
+    if horizontal_align is not None:
+        text_object.horizontal_align = horizontal_align
 
-    if raw_text.get("valign") is not None:
-        text_object.vertical_align = raw_text["valign"]
+    vertical_align = raw_text.get("valign")
+    if vertical_align is not None:
+        text_object.vertical_align = vertical_align
 
-    if raw_text.get("wrap") is not None:
-        text_object.wrap = raw_text["wrap"]
+    wrap = raw_text.get("wrap")
+    if wrap is not None:
+        text_object.wrap = wrap
 
     return text_object
 
 
+# Checked in order, the first key with a truthy value decides the parser.
+_SHAPE_PARSERS: Tuple[Tuple[str, Callable[[RawObject], TiledObject]], ...] = (
+    ("ellipse", _parse_ellipse),
+    ("point", _parse_point),
+    # Only tile objects have the `gid` key
+    ("gid", _parse_tile),
+    ("polygon", _parse_polygon),
+    ("polyline", _parse_polyline),
+    ("text", _parse_text),
+)
+
+
 def _get_parser(raw_object: RawObject) -> Callable[[RawObject], TiledObject]:
     """Get the parser function for a given raw object.
 
@@ -260,28 +293,9 @@ def _get_parser(raw_object: RawObject) -> Callable[[RawObject], TiledObject]:
     Returns:
         Callable[[RawObject], Object]: The parser function.
     """
-    if raw_object.get("ellipse"):
-        return _parse_ellipse
-
-    if raw_object.get("point"):
-        return _parse_point
-
-    # This is excluded from tests because the coverage is broken. I promise
-    # there are tests for Tile objects, but for some reason the coverage
-    # isn't picking up this if statement(though it does pickup the _parse_tile)
-    # function so who knows
-    if raw_object.get("gid"):  # pragma: no cover
-        # Only tile objects have the `gid` key
-        return _parse_tile
-
-    if raw_object.get("polygon"):
-        return _parse_polygon
-
-    if raw_object.get("polyline"):
-        return _parse_polyline
-
-    if raw_object.get("text"):
-        return _parse_text
+    for key, parser in _SHAPE_PARSERS:
+        if raw_object.get(key):
+            return parser
 
     # If it's none of the above, rectangle is the only one left.
     # Rectangle is the only object which has no special properties to signify that.
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 from typing import List, Optional, Union
 
@@ -175,9 +176,7 @@ def _parse_tile(raw_tile: RawTile, external_path: Optional[Path] = None) -> Tile
     tile = Tile(id=id_)
 
     if raw_tile.get("animation") is not None:
-        tile.animation = []
-        for frame in raw_tile["animation"]:
-            tile.animation.append(_parse_frame(frame))
+        tile.animation = [_parse_frame(frame) for frame in raw_tile["animation"]]
 
     if raw_tile.get("objectgroup") is not None:
         tile.objects = parse_layer(raw_tile["objectgroup"])
@@ -207,11 +206,13 @@ def _parse_tile(raw_tile: RawTile, external_path: Optional[Path] = None) -> Tile
         tile.image_height = raw_tile["imageheight"]
         tile.height = tile.image_height
 
+    # Tile classes repeat across a tileset, so they are interned to share one string
+    # per distinct value rather than one per tile.
     if raw_tile.get("type") is not None:
-        tile.class_ = raw_tile["type"]
+        tile.class_ = sys.intern(raw_tile["type"])
 
     if raw_tile.get("class") is not None:
-        tile.class_ = raw_tile["class"]
+        tile.class_ = sys.intern(raw_tile["class"])
 
     if raw_tile.get("x") is not None:
         tile.x = raw_tile["x"]
@@ -3,12 +3,15 @@
 import base64
 import gzip
 import importlib.util
+import json
+import struct
+import sys
 import xml.etree.ElementTree as etree
 import zlib
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.common_types import OrderedPair
 from pytiled_parser.layer import (
     Chunk,
     ImageLayer,
@@ -19,7 +22,7 @@ from pytiled_parser.layer import (
 )
 from pytiled_parser.parsers.tmx.properties import parse as parse_properties
 from pytiled_parser.parsers.tmx.tiled_object import parse as parse_object
-from pytiled_parser.util import parse_color
+from pytiled_parser.util import cached_ordered_pair, cached_size, parse_color
 
 # This optional zstd include is basically impossible to make a sensible test
 # for both ways. It's been tested manually, is unlikely to change or be effected
@@ -36,6 +39,26 @@ if zstd_spec:  # pragma: no cover
 else:
     zstd = None
 
+# pybase64 is an optional SIMD accelerated drop-in for the standard library's base64
+# decoding. Like zstd above, only the fallback is exercised by the test suite.
+pybase64_spec = importlib.util.find_spec("pybase64")
+if pybase64_spec:  # pragma: no cover
+    from pybase64 import b64decode
+else:
+    b64decode = base64.b64decode
+
+# python-isal provides zlib and gzip compatible modules backed by Intel's ISA-L, which
+# inflate data considerably faster than the standard library. As with the other
+# optional accelerators, only the standard library fallback is exercised by the test
+# suite.
+isal_spec = importlib.util.find_spec("isal")
+if isal_spec:  # pragma: no cover
+    from isal import isal_zlib as zlib_backend
+    from isal.igzip import decompress as gzip_decompress
+else:
+    zlib_backend = zlib
+    gzip_decompress = gzip.decompress
+
 
 def _convert_raw_tile_layer_data(data: List[int], layer_width: int) -> List[List[int]]:
     """Convert raw layer data into a nested lit based on the layer width
@@ -47,18 +70,15 @@ def _convert_raw_tile_layer_data(data: List[int], layer_width: int) -> List[List
     Returns:
         List[List[int]]: A nested list containing the converted data
     """
-    tile_grid: List[List[int]] = [[]]
-
-    column_count = 0
-    row_count = 0
-    for item in data:
-        column_count += 1
-        tile_grid[row_count].append(item)
-        if not column_count % layer_width and column_count < len(data):
-            row_count += 1
-            tile_grid.append([])
+    if not data:
+        return [[]]
 
-    return tile_grid
+    # The number of rows is known up front, so each row is sliced out whole instead
+    # of appending to it one tile at a time.
+    return [
+        data[row_start : row_start + layer_width]
+        for row_start in range(0, len(data), layer_width)
+    ]
 
 
 def _decode_tile_layer_data(
@@ -76,11 +96,13 @@ def _decode_tile_layer_data(
     Raises:
         ValueError: For an unsupported compression type.
     """
-    unencoded_data = base64.b64decode(data)
+    unencoded_data = b64decode(data.strip(), validate=False)
     if compression == "zlib":
-        unzipped_data = zlib.decompress(unencoded_data)
+        unzipped_data = zlib_backend.decompress(unencoded_data)
     elif compression == "gzip":
-        unzipped_data = gzip.decompress(unencoded_data)
+        # gzip.decompress reads every member of a multi-member stream, where a single
+        # zlib.decompress call would silently stop after the first one.
+        unzipped_data = gzip_decompress(unencoded_data)
     elif compression == "zstd" and zstd is None:
         raise ValueError(
             "zstd compression support is not installed."
@@ -92,23 +114,48 @@ def _decode_tile_layer_data(
     else:
         unzipped_data = unencoded_data
 
-    tile_grid: List[int] = []
+    # The data is a sequence of little-endian unsigned 32-bit integers, so it can be
+    # viewed directly as such rather than assembling each integer byte by byte. The
+    # memoryview doesn't copy the data, it is only read once by tolist().
+    # Any trailing bytes which don't make up a full integer are ignored.
+    tile_count = len(unzipped_data) // 4
+    if sys.byteorder == "little":
+        tile_grid: List[int] = (
+            memoryview(unzipped_data)[: tile_count * 4].cast("I").tolist()
+        )
+    else:  # pragma: no cover
+        # The native int format doesn't match, so unpack with an explicit byte order
+        tile_grid = list(struct.unpack_from(f"<{tile_count}I", unzipped_data))
 
-    byte_count = 0
-    int_count = 0
-    int_value = 0
-    for byte in unzipped_data:
-        int_value += byte << (byte_count * 8)
-        byte_count += 1
-        if not byte_count % 4:
-            byte_count = 0
-            int_count += 1
-            tile_grid.append(int_value)
-            int_value = 0
+    # The byte buffers aren't needed once the ids have been read, so drop them before
+    # building the rows rather than holding them until the function returns.
+    del unencoded_data, unzipped_data
 
     return _convert_raw_tile_layer_data(tile_grid, layer_width)
 
 
+def _decode_csv_tile_layer_data(data: str, layer_width: int) -> List[List[int]]:
+    """Decode CSV Encoded tile data.
+
+    Args:
+        data: The CSV encoded data
+        layer_width: Width of the layer
+
+    Returns:
+        List[List[int]]: A nested list containing the decoded data
+
+    Raises:
+        ValueError: If the data contains anything other than integers
+    """
+    # Wrapped in brackets the CSV data is a JSON array, so the C JSON decoder can
+    # convert every value in one call.
+    values = json.loads("[" + data.strip().rstrip(",") + "]")
+    if not all(type(value) is int for value in values):
+        raise ValueError("CSV tile layer data may only contain integers")
+
+    return _convert_raw_tile_layer_data(values, layer_width)
+
+
 def _parse_chunk(
     raw_chunk: etree.Element,
     encoding: Optional[str] = None,
@@ -124,82 +171,90 @@ def _parse_chunk(
     Returns:
         Chunk: The Chunk created from the raw_chunk
     """
+    attrib = raw_chunk.attrib
+    width = int(attrib["width"])
+
     if encoding == "base64":
         assert isinstance(compression, str)
         data = _decode_tile_layer_data(
-            raw_chunk.text, compression, int(raw_chunk.attrib["width"])  # type: ignore
+            raw_chunk.text, compression, width  # type: ignore
         )
     else:
-        data = _convert_raw_tile_layer_data(
-            [int(v.strip()) for v in raw_chunk.text.split(",")],  # type: ignore
-            int(raw_chunk.attrib["width"]),
-        )
+        data = _decode_csv_tile_layer_data(raw_chunk.text, width)  # type: ignore
 
     return Chunk(
-        coordinates=OrderedPair(int(raw_chunk.attrib["x"]), int(raw_chunk.attrib["y"])),
-        size=Size(int(raw_chunk.attrib["width"]), int(raw_chunk.attrib["height"])),
+        coordinates=OrderedPair(int(attrib["x"]), int(attrib["y"])),
+        size=cached_size(width, int(attrib["height"])),
         data=data,
     )
 
 
-def _parse_common(raw_layer: etree.Element) -> Layer:
-    """Create a Layer containing all the attributes common to all layer types.
+def _parse_common(raw_layer: etree.Element) -> Dict[str, Any]:
+    """Parse the attributes common to all layer types.
 
-    This is to create the stub Layer object that can then be used to create the actual
-        specific sub-classes of Layer.
+    These are returned as keyword arguments which can be passed straight into the
+        constructor of the specific sub-class of Layer, rather than building a stub
+        Layer object just to copy its attributes over.
 
     Args:
         raw_layer: XML Element to get common attributes from
 
     Returns:
-        Layer: The attributes in common of all layer types
+        Dict[str, Any]: The attributes in common of all layer types
     """
-    if raw_layer.attrib.get("name") is None:
-        raw_layer.attrib["name"] = ""
+    attrib = raw_layer.attrib
 
-    common = Layer(
-        name=raw_layer.attrib["name"],
-    )
+    common: Dict[str, Any] = {"name": attrib.get("name", "")}
 
-    if raw_layer.attrib.get("opacity") is not None:
-        common.opacity = float(raw_layer.attrib["opacity"])
+    opacity = attrib.get("opacity")
+    if opacity is not None:
+        common["opacity"] = float(opacity)
 
-    if raw_layer.attrib.get("visible") is not None:
-        common.visible = bool(int(raw_layer.attrib["visible"]))
+    visible = attrib.get("visible")
+    if visible is not None:
+        common["visible"] = bool(int(visible))
 
-    if raw_layer.attrib.get("id") is not None:
-        common.id = int(raw_layer.attrib["id"])
+    id_ = attrib.get("id")
+    if id_ is not None:
+        common["id"] = int(id_)
 
-    if raw_layer.attrib.get("offsetx") is not None:
-        common.offset = OrderedPair(
-            float(raw_layer.attrib["offsetx"]), float(raw_layer.attrib["offsety"])
+    offset_x = attrib.get("offsetx")
+    if offset_x is not None:
+        common["offset"] = cached_ordered_pair(
+            float(offset_x), float(attrib["offsety"])
         )
 
-    properties_element = raw_layer.find("./properties")
+    properties_element = raw_layer.find("properties")
     if properties_element is not None:
-        common.properties = parse_properties(properties_element)
+        common["properties"] = parse_properties(properties_element)
 
     parallax = [1.0, 1.0]
 
-    if raw_layer.attrib.get("parallaxx") is not None:
-        parallax[0] = float(raw_layer.attrib["parallaxx"])
+    parallax_x = attrib.get("parallaxx")
+    if parallax_x is not None:
+        parallax[0] = float(parallax_x)
 
-    if raw_layer.attrib.get("parallaxy") is not None:
-        parallax[1] = float(raw_layer.attrib["parallaxy"])
+    parallax_y = attrib.get("parallaxy")
+    if parallax_y is not None:
+        parallax[1] = float(parallax_y)
 
-    common.parallax_factor = OrderedPair(parallax[0], parallax[1])
+    common["parallax_factor"] = cached_ordered_pair(parallax[0], parallax[1])
 
-    if raw_layer.attrib.get("tintcolor") is not None:
-        common.tint_color = parse_color(raw_layer.attrib["tintcolor"])
+    tint_color = attrib.get("tintcolor")
+    if tint_color is not None:
+        common["tint_color"] = parse_color(tint_color)
 
-    if raw_layer.attrib.get("class") is not None:
-        common.class_ = raw_layer.attrib["class"]
+    class_ = attrib.get("class")
+    if class_ is not None:
+        common["class_"] = class_
 
-    if raw_layer.attrib.get("repeatx") is not None:
-        common.repeat_x = bool(int(raw_layer.attrib["repeatx"]))
+    repeat_x = attrib.get("repeatx")
+    if repeat_x is not None:
+        common["repeat_x"] = bool(int(repeat_x))
 
-    if raw_layer.attrib.get("repeaty") is not None:
-        common.repeat_y = bool(int(raw_layer.attrib["repeaty"]))
+    repeat_y = attrib.get("repeaty")
+    if repeat_y is not None:
+        common["repeat_y"] = bool(int(repeat_y))
 
     return common
 
@@ -213,22 +268,17 @@ def _parse_tile_layer(raw_layer: etree.Element) -> TileLayer:
     Returns:
         TileLayer: The TileLayer created from raw_layer
     """
-    common = _parse_common(raw_layer).__dict__
-    del common["size"]
+    common = _parse_common(raw_layer)
+    layer_width = int(raw_layer.attrib["width"])
     tile_layer = TileLayer(
-        size=Size(int(raw_layer.attrib["width"]), int(raw_layer.attrib["height"])),
+        size=cached_size(layer_width, int(raw_layer.attrib["height"])),
         **common,
     )
 
     data_element = raw_layer.find("data")
     if data_element is not None:
-        encoding = None
-        if data_element.attrib.get("encoding") is not None:
-            encoding = data_element.attrib["encoding"]
-
-        compression = ""
-        if data_element.attrib.get("compression") is not None:
-            compression = data_element.attrib["compression"]
+        encoding = data_element.attrib.get("encoding")
+        compression = data_element.attrib.get("compression", "")
 
         raw_chunks = data_element.findall("chunk")
         if not raw_chunks:
@@ -236,23 +286,17 @@ def _parse_tile_layer(raw_layer: etree.Element) -> TileLayer:
                 tile_layer.data = _decode_tile_layer_data(
                     data=data_element.text,  # type: ignore
                     compression=compression,
-                    layer_width=int(raw_layer.attrib["width"]),
+                    layer_width=layer_width,
                 )
             else:
-                tile_layer.data = _convert_raw_tile_layer_data(
-                    [int(v.strip()) for v in data_element.text.split(",")],  # type: ignore
-                    int(raw_layer.attrib["width"]),
+                tile_layer.data = _decode_csv_tile_layer_data(
+                    data_element.text, layer_width  # type: ignore
                 )
         else:
-            chunks = []
-            for raw_chunk in raw_chunks:
-                chunks.append(
-                    _parse_chunk(
-                        raw_chunk,
-                        encoding,
-                        compression,
-                    )
-                )
+            chunks = [
+                _parse_chunk(raw_chunk, encoding, compression)
+                for raw_chunk in raw_chunks
+            ]
 
             if chunks:
                 tile_layer.chunks = chunks
@@ -271,17 +315,18 @@ def _parse_object_layer(
     Returns:
         ObjectLayer: The ObjectLayer created from raw_layer
     """
-    objects = []
-    for object_ in raw_layer.findall("./object"):
-        objects.append(parse_object(object_, parent_dir))
+    objects = [
+        parse_object(object_, parent_dir) for object_ in raw_layer.iterfind("object")
+    ]
 
     object_layer = ObjectLayer(
         tiled_objects=objects,
-        **_parse_common(raw_layer).__dict__,
+        **_parse_common(raw_layer),
     )
 
-    if raw_layer.attrib.get("draworder") is not None:
-        object_layer.draw_order = raw_layer.attrib["draworder"]
+    draw_order = raw_layer.attrib.get("draworder")
+    if draw_order is not None:
+        object_layer.draw_order = draw_order
 
     return object_layer
 
@@ -295,18 +340,20 @@ def _parse_image_layer(raw_layer: etree.Element) -> ImageLayer:
     Returns:
         ImageLayer: The ImageLayer created from raw_layer
     """
-    image_element = raw_layer.find("./image")
+    image_element = raw_layer.find("image")
     if image_element is not None:
-        source = Path(image_element.attrib["source"])
+        image_attrib = image_element.attrib
+        source = Path(image_attrib["source"])
 
         transparent_color = None
-        if image_element.attrib.get("trans") is not None:
-            transparent_color = parse_color(image_element.attrib["trans"])
+        trans = image_attrib.get("trans")
+        if trans is not None:
+            transparent_color = parse_color(trans)
 
         image_layer = ImageLayer(
             image=source,
             transparent_color=transparent_color,
-            **_parse_common(raw_layer).__dict__,
+            **_parse_common(raw_layer),
         )
 
         return image_layer
@@ -325,26 +372,23 @@ def _parse_group_layer(
     Returns:
         LayerGroup: The LayerGroup created from raw_layer
     """
-    layers: List[Layer] = []
-    for layer in raw_layer.findall("./layer"):
-        layers.append(_parse_tile_layer(layer))
+    # The children are visited once and dispatched on their tag, which also keeps the
+    # layers in the order they appear in the group.
+    layers: List[Layer] = [
+        _LAYER_PARSERS[child.tag](child, parent_dir)
+        for child in raw_layer
+        if child.tag in _LAYER_PARSERS
+    ]
 
-    for layer in raw_layer.findall("./objectgroup"):
-        layers.append(_parse_object_layer(layer, parent_dir))
+    return LayerGroup(layers=layers, **_parse_common(raw_layer))
 
-    for layer in raw_layer.findall("./imagelayer"):
-        layers.append(_parse_image_layer(layer))
 
-    for layer in raw_layer.findall("./group"):
-        layers.append(_parse_group_layer(layer, parent_dir))
-    # layers = []
-    # layers = [
-    #    parse(child_layer, parent_dir=parent_dir)
-    #    for child_layer in raw_layer.iter()
-    #    if child_layer.tag in ["layer", "objectgroup", "imagelayer", "group"]
-    # ]
-
-    return LayerGroup(layers=layers, **_parse_common(raw_layer).__dict__)
+_LAYER_PARSERS: Dict[str, Callable[[etree.Element, Optional[Path]], Layer]] = {
+    "objectgroup": _parse_object_layer,
+    "group": _parse_group_layer,
+    "imagelayer": lambda raw_layer, parent_dir: _parse_image_layer(raw_layer),
+    "layer": lambda raw_layer, parent_dir: _parse_tile_layer(raw_layer),
+}
 
 
 def parse(
@@ -365,15 +409,8 @@ def parse(
     Raises:
         RuntimeError: For an invalid layer type being provided
     """
-    type_ = raw_layer.tag
-
-    if type_ == "objectgroup":
-        return _parse_object_layer(raw_layer, parent_dir)
-    elif type_ == "group":
-        return _parse_group_layer(raw_layer, parent_dir)
-    elif type_ == "imagelayer":
-        return _parse_image_layer(raw_layer)
-    elif type_ == "layer":
-        return _parse_tile_layer(raw_layer)
-    else:
+    layer_parser = _LAYER_PARSERS.get(raw_layer.tag)
+    if layer_parser is None:
         raise RuntimeError("Unknown layer type in map file!")
+
+    return layer_parser(raw_layer, parent_dir)
@@ -1,35 +1,37 @@
 import xml.etree.ElementTree as etree
 from pathlib import Path
+from typing import Callable, Dict
 
 from pytiled_parser.properties import Properties, Property
 from pytiled_parser.util import parse_color
 
+# Converters for each property type which isn't stored as a plain string.
+# Tiled's int type is loaded as a float to match the JSON parser.
+_PROPERTY_PARSERS: Dict[str, Callable[[str], Property]] = {
+    "file": Path,
+    "color": parse_color,
+    "int": float,
+    "float": float,
+    "bool": lambda value: value == "true",
+}
+
 
 def parse(raw_properties: etree.Element) -> Properties:
     final: Properties = {}
     value: Property
 
-    for raw_property in raw_properties.findall("property"):
-        type_ = raw_property.attrib.get("type")
+    for raw_property in raw_properties.iterfind("property"):
+        attrib = raw_property.attrib
 
-        if "value" not in raw_property.attrib:
+        value_ = attrib.get("value")
+        if value_ is None:
             continue
 
-        value_ = raw_property.attrib["value"]
-
-        if type_ == "file":
-            value = Path(value_)
-        elif type_ == "color":
-            value = parse_color(value_)
-        elif type_ == "int" or type_ == "float":
-            value = float(value_)
-        elif type_ == "bool":
-            if value_ == "true":
-                value = True
-            else:
-                value = False
+        property_parser = _PROPERTY_PARSERS.get(attrib.get("type", "string"))
+        if property_parser is not None:
+            value = property_parser(value_)
         else:
             value = value_
-        final[raw_property.attrib["name"]] = value
+        final[attrib["name"]] = value
 
     return final
@@ -1,84 +1,159 @@
-import json
+import io
 import xml.etree.ElementTree as etree
 from pathlib import Path
 
 from pytiled_parser.common_types import OrderedPair, Size
-from pytiled_parser.exception import UnknownFormat
-from pytiled_parser.parsers.json.tileset import parse as parse_json_tileset
+from pytiled_parser.parsers.external_tileset import load_external_tileset
 from pytiled_parser.parsers.tmx.layer import parse as parse_layer
 from pytiled_parser.parsers.tmx.properties import parse as parse_properties
 from pytiled_parser.parsers.tmx.tileset import parse as parse_tmx_tileset
-from pytiled_parser.tiled_map import TiledMap, TilesetDict
-from pytiled_parser.util import check_format, parse_color
+from pytiled_parser.tiled_map import MapHeader, TiledMap, TilesetDict
+from pytiled_parser.tileset import Tileset
+from pytiled_parser.util import parse_color, xml_backend
+
+LAYER_TAGS = {"layer", "objectgroup", "imagelayer", "group"}
+
+
+def _parse_tileset(raw_tileset: etree.Element, parent_dir: Path) -> Tileset:
+    """Parse a tileset element of a map, loading the tileset file if it is external.
+
+    Args:
+        raw_tileset: The tileset element from the map.
+        parent_dir: The directory that the map file is in.
+
+    Returns:
+        Tileset: The parsed Tileset.
+    """
+    tileset_attrib = raw_tileset.attrib
+    firstgid = int(tileset_attrib["firstgid"])
+    source = tileset_attrib.get("source")
+    if source is None:
+        # Is an embedded Tileset
+        return parse_tmx_tileset(raw_tileset, firstgid)
+
+    # Is an external Tileset
+    return load_external_tileset(Path(parent_dir / source), firstgid)
+
+
+def parse_header(file: Path) -> MapHeader:
+    """Parse only the attributes and properties of a Tiled map.
+
+    Tiled writes the properties of a map before any of its tilesets or layers, so the
+    file is only read up to the first tileset or layer.
+
+    Args:
+        file: Path to the map file.
+
+    Returns:
+        MapHeader: The parsed MapHeader.
+    """
+    properties_element = None
+
+    depth = 0
+    with open(file, "rb") as map_file:
+        for event, element in xml_backend.iterparse(map_file, events=("start", "end")):
+            if event == "end":
+                depth -= 1
+                if depth == 1 and element.tag == "properties":
+                    properties_element = element
+                    break
+                continue
+
+            if depth == 0:
+                raw_map = element
+            elif depth == 1 and (element.tag == "tileset" or element.tag in LAYER_TAGS):
+                break
+            depth += 1
+
+    attrib = raw_map.attrib
+
+    header = MapHeader(
+        map_file=file,
+        infinite=bool(int(attrib["infinite"])),
+        map_size=Size(int(attrib["width"]), int(attrib["height"])),
+        orientation=attrib["orientation"],
+        render_order=attrib["renderorder"],
+        tile_size=Size(int(attrib["tilewidth"]), int(attrib["tileheight"])),
+    )
+
+    class_ = attrib.get("class")
+    if class_ is not None:
+        header.class_ = class_
+
+    background_color = attrib.get("backgroundcolor")
+    if background_color is not None:
+        header.background_color = parse_color(background_color)
+
+    if properties_element is not None:
+        header.properties = parse_properties(properties_element)
+
+    return header
 
 
 def parse(file: Path) -> TiledMap:
     """Parse the raw Tiled map into a pytiled_parser type.
 
+    The map is read with iterparse, so each top level element is parsed as soon as
+    it has been fully read and then released, rather than building the whole tree
+    up front and walking it afterwards.
+
     Args:
         file: Path to the map file.
 
     Returns:
         TiledMap: A parsed TiledMap.
     """
-    with open(file) as map_file:
-        raw_map = etree.parse(map_file).getroot()
-
     parent_dir = file.parent
 
-    raw_tilesets = raw_map.findall("./tileset")
     tilesets: TilesetDict = {}
-
-    for raw_tileset in raw_tilesets:
-        if raw_tileset.attrib.get("source") is not None:
-            # Is an external Tileset
-            tileset_path = Path(parent_dir / raw_tileset.attrib["source"])
-            parser = check_format(tileset_path)
-            with open(tileset_path) as tileset_file:
-                if parser == "tmx":
-                    raw_tileset_external = etree.parse(tileset_file).getroot()
-                    tilesets[int(raw_tileset.attrib["firstgid"])] = parse_tmx_tileset(
-                        raw_tileset_external,
-                        int(raw_tileset.attrib["firstgid"]),
-                        external_path=tileset_path.parent,
-                    )
-                elif parser == "json":
-                    tilesets[int(raw_tileset.attrib["firstgid"])] = parse_json_tileset(
-                        json.load(tileset_file),
-                        int(raw_tileset.attrib["firstgid"]),
-                        external_path=tileset_path.parent,
-                    )
-                else:
-                    raise UnknownFormat(
-                        "Unkown Tileset format, please use either the TSX or JSON format."
-                    )
-
-        else:
-            # Is an embedded Tileset
-            tilesets[int(raw_tileset.attrib["firstgid"])] = parse_tmx_tileset(
-                raw_tileset, int(raw_tileset.attrib["firstgid"])
-            )
-
     layers = []
-    for element in raw_map.iter():
-        if element.tag in ["layer", "objectgroup", "imagelayer", "group"]:
+    properties_element = None
+
+    depth = 0
+    with open(file, "rb") as map_file:
+        map_data = io.BytesIO(map_file.read())
+
+    for event, element in xml_backend.iterparse(map_data, events=("start", "end")):
+        if event == "start":
+            if depth == 0:
+                raw_map = element
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth != 1:
+            continue
+
+        tag = element.tag
+        if tag == "tileset":
+            tileset = _parse_tileset(element, parent_dir)
+            tilesets[tileset.firstgid] = tileset
+        elif tag in LAYER_TAGS:
             layers.append(parse_layer(element, parent_dir))
+        elif tag == "properties":
+            properties_element = element
+
+        # Detach the element from the map once it has been handled, so that it and
+        # its subtree (such as all of the data and chunks of a tile layer) can be
+        # freed straight away instead of staying attached to the root until the
+        # whole file has been read.
+        raw_map.remove(element)
+
+    attrib = raw_map.attrib
 
     map_ = TiledMap(
         map_file=file,
-        infinite=bool(int(raw_map.attrib["infinite"])),
+        infinite=bool(int(attrib["infinite"])),
         layers=layers,
-        map_size=Size(int(raw_map.attrib["width"]), int(raw_map.attrib["height"])),
-        next_layer_id=int(raw_map.attrib["nextlayerid"]),
-        next_object_id=int(raw_map.attrib["nextobjectid"]),
-        orientation=raw_map.attrib["orientation"],
-        render_order=raw_map.attrib["renderorder"],
-        tiled_version=raw_map.attrib["tiledversion"],
-        tile_size=Size(
-            int(raw_map.attrib["tilewidth"]), int(raw_map.attrib["tileheight"])
-        ),
+        map_size=Size(int(attrib["width"]), int(attrib["height"])),
+        next_layer_id=int(attrib["nextlayerid"]),
+        next_object_id=int(attrib["nextobjectid"]),
+        orientation=attrib["orientation"],
+        render_order=attrib["renderorder"],
+        tiled_version=attrib["tiledversion"],
+        tile_size=Size(int(attrib["tilewidth"]), int(attrib["tileheight"])),
         tilesets=tilesets,
-        version=raw_map.attrib["version"],
+        version=attrib["version"],
     )
 
     layers = [layer for layer in map_.layers if hasattr(layer, "tiled_objects")]
@@ -126,33 +201,39 @@ def parse(file: Path) -> TiledMap:
                     tiled_object.new_tileset = None
                     tiled_object.new_tileset_path = None
 
-    if raw_map.attrib.get("backgroundcolor") is not None:
-        map_.background_color = parse_color(raw_map.attrib["backgroundcolor"])
+    background_color = attrib.get("backgroundcolor")
+    if background_color is not None:
+        map_.background_color = parse_color(background_color)
 
-    if raw_map.attrib.get("hexsidelength") is not None:
-        map_.hex_side_length = int(raw_map.attrib["hexsidelength"])
+    hex_side_length = attrib.get("hexsidelength")
+    if hex_side_length is not None:
+        map_.hex_side_length = int(hex_side_length)
 
-    properties_element = raw_map.find("./properties")
-    if properties_element:
+    if properties_element is not None:
         map_.properties = parse_properties(properties_element)
 
-    if raw_map.attrib.get("staggeraxis") is not None:
-        map_.stagger_axis = raw_map.attrib["staggeraxis"]
+    stagger_axis = attrib.get("staggeraxis")
+    if stagger_axis is not None:
+        map_.stagger_axis = stagger_axis
 
-    if raw_map.attrib.get("staggerindex") is not None:
-        map_.stagger_index = raw_map.attrib["staggerindex"]
+    stagger_index = attrib.get("staggerindex")
+    if stagger_index is not None:
+        map_.stagger_index = stagger_index
 
-    if raw_map.attrib.get("class") is not None:
-        map_.class_ = raw_map.attrib["class"]
+    class_ = attrib.get("class")
+    if class_ is not None:
+        map_.class_ = class_
 
     _parallax_origin_x = 0.0
     _parallax_origin_y = 0.0
 
-    if raw_map.attrib.get("parallaxoriginx") is not None:
-        _parallax_origin_x = float(raw_map.attrib["parallaxoriginx"])
+    parallax_origin_x = attrib.get("parallaxoriginx")
+    if parallax_origin_x is not None:
+        _parallax_origin_x = float(parallax_origin_x)
 
-    if raw_map.get("parallaxoriginy") is not None:
-        _parallax_origin_y = float(raw_map.attrib["parallaxoriginy"])
+    parallax_origin_y = attrib.get("parallaxoriginy")
+    if parallax_origin_y is not None:
+        _parallax_origin_y = float(parallax_origin_y)
 
     map_.parallax_origin = OrderedPair(_parallax_origin_x, _parallax_origin_y)
 
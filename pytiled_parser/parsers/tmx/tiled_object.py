@@ -1,8 +1,9 @@
+import sys
 import xml.etree.ElementTree as etree
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.common_types import OrderedPair
 from pytiled_parser.parsers.tmx.properties import parse as parse_properties
 from pytiled_parser.tiled_object import (
     Ellipse,
@@ -14,49 +15,50 @@ from pytiled_parser.tiled_object import (
     Tile,
     TiledObject,
 )
-from pytiled_parser.util import load_object_template, parse_color
+from pytiled_parser.util import (
+    cached_ordered_pair,
+    cached_size,
+    load_object_template,
+    parse_color,
+)
+
 
+def _parse_common(raw_object: etree.Element) -> Dict[str, Any]:
+    """Parse the attributes common to all types of objects.
 
-def _parse_common(raw_object: etree.Element) -> TiledObject:
-    """Create an Object containing all the attributes common to all types of objects.
+    These are returned as keyword arguments which can be passed straight into the
+        constructor of the specific sub-class of TiledObject.
 
     Args:
         raw_object: XML Element to get common attributes from
 
     Returns:
-        Object: The attributes in common of all types of objects
+        Dict[str, Any]: The attributes in common of all types of objects
     """
 
-    common = TiledObject(
-        id=int(raw_object.attrib["id"]),
-        coordinates=OrderedPair(
-            float(raw_object.attrib["x"]), float(raw_object.attrib["y"])
-        ),
-    )
-
-    if raw_object.attrib.get("width") is not None:
-        common.size = Size(
-            float(raw_object.attrib["width"]), float(raw_object.attrib["height"])
-        )
-
-    if raw_object.attrib.get("visible") is not None:
-        common.visible = bool(int(raw_object.attrib["visible"]))
-
-    if raw_object.attrib.get("rotation") is not None:
-        common.rotation = float(raw_object.attrib["rotation"])
-
-    if raw_object.attrib.get("name") is not None:
-        common.name = raw_object.attrib["name"]
-
-    if raw_object.attrib.get("type") is not None:
-        common.class_ = raw_object.attrib["type"]
-
-    if raw_object.attrib.get("class") is not None:
-        common.class_ = raw_object.attrib["class"]
-
-    properties_element = raw_object.find("./properties")
-    if properties_element:
-        common.properties = parse_properties(properties_element)
+    attrib = raw_object.attrib
+
+    # Optional attributes are read with their default values in place, so every
+    # attribute is a single lookup passed straight into the constructor.
+    # Object names and classes repeat across a map, so they are interned to share one
+    # string per distinct value rather than one per object.
+    visible = attrib.get("visible")
+    common: Dict[str, Any] = {
+        "id": int(attrib["id"]),
+        "coordinates": cached_ordered_pair(float(attrib["x"]), float(attrib["y"])),
+        "visible": True if visible is None else bool(int(visible)),
+        "rotation": float(attrib.get("rotation", 0)),
+        "name": sys.intern(attrib.get("name", "")),
+        "class_": sys.intern(attrib.get("class", attrib.get("type", ""))),
+    }
+
+    width = attrib.get("width")
+    if width is not None:
+        common["size"] = cached_size(float(width), float(attrib["height"]))
+
+    properties_element = raw_object.find("properties")
+    if properties_element is not None:
+        common["properties"] = parse_properties(properties_element)
 
     return common
 
@@ -70,7 +72,7 @@ def _parse_ellipse(raw_object: etree.Element) -> Ellipse:
     Returns:
         Ellipse: The Ellipse object created from the raw object
     """
-    return Ellipse(**_parse_common(raw_object).__dict__)
+    return Ellipse(**_parse_common(raw_object))
 
 
 def _parse_rectangle(raw_object: etree.Element) -> Rectangle:
@@ -82,7 +84,7 @@ def _parse_rectangle(raw_object: etree.Element) -> Rectangle:
     Returns:
         Rectangle: The Rectangle object created from the raw object
     """
-    return Rectangle(**_parse_common(raw_object).__dict__)
+    return Rectangle(**_parse_common(raw_object))
 
 
 def _parse_point(raw_object: etree.Element) -> Point:
@@ -94,7 +96,23 @@ def _parse_point(raw_object: etree.Element) -> Point:
     Returns:
         Point: The Point object created from the raw object
     """
-    return Point(**_parse_common(raw_object).__dict__)
+    return Point(**_parse_common(raw_object))
+
+
+def _parse_points(raw_points: str) -> List[OrderedPair]:
+    """Parse a TMX points string of the form "x,y x,y ..." into a list of OrderedPairs.
+
+    Args:
+        raw_points: The points string from a polygon or polyline element
+
+    Returns:
+        List[OrderedPair]: The parsed points
+    """
+    # Zipping the iterator with itself pairs up consecutive values, and _make builds
+    # each OrderedPair from its tuple without going through the keyword argument
+    # handling of the NamedTuple constructor.
+    values = map(float, raw_points.replace(" ", ",").split(","))
+    return list(map(OrderedPair._make, zip(values, values)))
 
 
 def _parse_polygon(raw_object: etree.Element) -> Polygon:
@@ -107,13 +125,11 @@ def _parse_polygon(raw_object: etree.Element) -> Polygon:
         Polygon: The Polygon object created from the raw object
     """
     polygon = []
-    polygon_element = raw_object.find("./polygon")
+    polygon_element = raw_object.find("polygon")
     if polygon_element is not None:
-        for raw_point in polygon_element.attrib["points"].split(" "):
-            point = raw_point.split(",")
-            polygon.append(OrderedPair(float(point[0]), float(point[1])))
+        polygon = _parse_points(polygon_element.attrib["points"])
 
-    return Polygon(points=polygon, **_parse_common(raw_object).__dict__)
+    return Polygon(points=polygon, **_parse_common(raw_object))
 
 
 def _parse_polyline(raw_object: etree.Element) -> Polyline:
@@ -126,13 +142,11 @@ def _parse_polyline(raw_object: etree.Element) -> Polyline:
         Polyline: The Polyline object created from the raw object
     """
     polyline = []
-    polyline_element = raw_object.find("./polyline")
+    polyline_element = raw_object.find("polyline")
     if polyline_element is not None:
-        for raw_point in polyline_element.attrib["points"].split(" "):
-            point = raw_point.split(",")
-            polyline.append(OrderedPair(float(point[0]), float(point[1])))
+        polyline = _parse_points(polyline_element.attrib["points"])
 
-    return Polyline(points=polyline, **_parse_common(raw_object).__dict__)
+    return Polyline(points=polyline, **_parse_common(raw_object))
 
 
 def _parse_tile(
@@ -152,7 +166,7 @@ def _parse_tile(
         gid=int(raw_object.attrib["gid"]),
         new_tileset=new_tileset,
         new_tileset_path=new_tileset_path,
-        **_parse_common(raw_object).__dict__,
+        **_parse_common(raw_object),
     )
 
 
@@ -166,7 +180,7 @@ def _parse_text(raw_object: etree.Element) -> Text:
         Text: The Text object created from the raw object
     """
     # required attributes
-    text_element = raw_object.find("./text")
+    text_element = raw_object.find("text")
 
     if text_element is not None:
         text = text_element.text
@@ -174,46 +188,68 @@ def _parse_text(raw_object: etree.Element) -> Text:
         if not text:
             text = ""
         # create base Text object
-        text_object = Text(text=text, **_parse_common(raw_object).__dict__)
+        text_object = Text(text=text, **_parse_common(raw_object))
 
         # optional attributes
 
-        if text_element.attrib.get("color") is not None:
-            text_object.color = parse_color(text_element.attrib["color"])
+        text_attrib = text_element.attrib
 
-        if text_element.attrib.get("fontfamily") is not None:
-            text_object.font_family = text_element.attrib["fontfamily"]
+        color = text_attrib.get("color")
+        if color is not None:
+            text_object.color = parse_color(color)
 
-        if text_element.attrib.get("pixelsize") is not None:
-            text_object.font_size = float(text_element.attrib["pixelsize"])
+        font_family = text_attrib.get("fontfamily")
+        if font_family is not None:
+            text_object.font_family = font_family
 
-        if text_element.attrib.get("bold") is not None:
-            text_object.bold = bool(int(text_element.attrib["bold"]))
+        font_size = text_attrib.get("pixelsize")
+        if font_size is not None:
+            text_object.font_size = float(font_size)
 
-        if text_element.attrib.get("italic") is not None:
-            text_object.italic = bool(int(text_element.attrib["italic"]))
+        bold = text_attrib.get("bold")
+        if bold is not None:
+            text_object.bold = bool(int(bold))
 
-        if text_element.attrib.get("kerning") is not None:
-            text_object.kerning = bool(int(text_element.attrib["kerning"]))
+        italic = text_attrib.get("italic")
+        if italic is not None:
+            text_object.italic = bool(int(italic))
 
-        if text_element.attrib.get("strikeout") is not None:
-            text_object.strike_out = bool(int(text_element.attrib["strikeout"]))
+        kerning = text_attrib.get("kerning")
+        if kerning is not None:
+            text_object.kerning = bool(int(kerning))
 
-        if text_element.attrib.get("underline") is not None:
-            text_object.underline = bool(int(text_element.attrib["underline"]))
+        strike_out = text_attrib.get("strikeout")
+        if strike_out is not None:
+            text_object.strike_out = bool(int(strike_out))
 
-        if text_element.attrib.get("halign") is not None:
-            text_object.horizontal_align = text_element.attrib["halign"]
+        underline = text_attrib.get("underline")
+        if underline is not None:
+            text_object.underline = bool(int(underline))
 
-        if text_element.attrib.get("valign") is not None:
-            text_object.vertical_align = text_element.attrib["valign"]
+        horizontal_align = text_attrib.get("halign")
+        if horizontal_align is not None:
+            text_object.horizontal_align = horizontal_align
 
-        if text_element.attrib.get("wrap") is not None:
-            text_object.wrap = bool(int(text_element.attrib["wrap"]))
+        vertical_align = text_attrib.get("valign")
+        if vertical_align is not None:
+            text_object.vertical_align = vertical_align
+
+        wrap = text_attrib.get("wrap")
+        if wrap is not None:
+            text_object.wrap = bool(int(wrap))
 
     return text_object
 
 
+_SHAPE_PARSERS: Dict[str, Callable[[etree.Element], TiledObject]] = {
+    "ellipse": _parse_ellipse,
+    "point": _parse_point,
+    "polygon": _parse_polygon,
+    "polyline": _parse_polyline,
+    "text": _parse_text,
+}
+
+
 def _get_parser(raw_object: etree.Element) -> Callable[[etree.Element], TiledObject]:
     """Get the parser function for a given raw object.
 
@@ -225,20 +261,11 @@ def _get_parser(raw_object: etree.Element) -> Callable[[etree.Element], TiledObj
     Returns:
         Callable[[Element], Object]: The parser function.
     """
-    if raw_object.find("./ellipse") is not None:
-        return _parse_ellipse
-
-    if raw_object.find("./point") is not None:
-        return _parse_point
-
-    if raw_object.find("./polygon") is not None:
-        return _parse_polygon
-
-    if raw_object.find("./polyline") is not None:
-        return _parse_polyline
-
-    if raw_object.find("./text") is not None:
-        return _parse_text
+    # Check the children in one pass rather than doing a find() for each shape
+    for child in raw_object:
+        parser = _SHAPE_PARSERS.get(child.tag)
+        if parser is not None:
+            return parser
 
     # If it's none of the above, rectangle is the only one left.
     # Rectangle is the only object which has no properties to signify that.
@@ -261,34 +288,37 @@ def parse(raw_object: etree.Element, parent_dir: Optional[Path] = None) -> Tiled
     new_tileset = None
     new_tileset_path = None
 
-    if raw_object.attrib.get("template"):
+    template_source = raw_object.attrib.get("template")
+    if template_source:
         if not parent_dir:
             raise RuntimeError(
                 "A parent directory must be specified when using object templates."
             )
-        template_path = Path(parent_dir / raw_object.attrib["template"])
+        template_path = Path(parent_dir / template_source)
         template, new_tileset, new_tileset_path = load_object_template(template_path)
 
-        if isinstance(template, etree.Element):
-            new_object = template.find("./object")
-            if new_object is not None:
-                for key, val in raw_object.attrib.items():
-                    if key == "template":
-                        continue
-                    new_object.attrib[key] = val
-
-                properties_element = raw_object.find("./properties")
-                if properties_element is not None:
-                    new_object.append(properties_element)
-
-                raw_object = new_object
-        elif isinstance(template, dict):
+        # The template is checked against dict rather than etree.Element, because
+        # when lxml is installed the element will not be a stdlib Element.
+        if isinstance(template, dict):
             # load the JSON object into the XML object
             raise NotImplementedError(
                 "Loading JSON object templates inside a TMX map is currently not supported, "
                 "but will be in a future release."
             )
 
+        new_object = template.find("object")
+        if new_object is not None:
+            for key, val in raw_object.attrib.items():
+                if key == "template":
+                    continue
+                new_object.attrib[key] = val
+
+            properties_element = raw_object.find("properties")
+            if properties_element is not None:
+                new_object.append(properties_element)
+
+            raw_object = new_object
+
     if raw_object.attrib.get("gid"):
         return _parse_tile(raw_object, new_tileset, new_tileset_path)
 
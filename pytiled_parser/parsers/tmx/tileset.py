@@ -1,3 +1,4 @@
+import sys
 import xml.etree.ElementTree as etree
 from pathlib import Path
 from typing import Optional
@@ -20,9 +21,10 @@ def _parse_frame(raw_frame: etree.Element) -> Frame:
         Frame: The Frame created from the raw_frame
     """
 
+    attrib = raw_frame.attrib
     return Frame(
-        duration=int(raw_frame.attrib["duration"]),
-        tile_id=int(raw_frame.attrib["tileid"]),
+        duration=int(attrib["duration"]),
+        tile_id=int(attrib["tileid"]),
     )
 
 
@@ -36,10 +38,11 @@ def _parse_grid(raw_grid: etree.Element) -> Grid:
         Grid: The Grid created from the raw_grid
     """
 
+    attrib = raw_grid.attrib
     return Grid(
-        orientation=raw_grid.attrib["orientation"],
-        width=int(raw_grid.attrib["width"]),
-        height=int(raw_grid.attrib["height"]),
+        orientation=attrib["orientation"],
+        width=int(attrib["width"]),
+        height=int(attrib["height"]),
     )
 
 
@@ -53,13 +56,12 @@ def _parse_transformations(raw_transformations: etree.Element) -> Transformation
         Transformations: The Transformations created from the raw_transformations
     """
 
+    attrib = raw_transformations.attrib
     return Transformations(
-        hflip=bool(int(raw_transformations.attrib["hflip"])),
-        vflip=bool(int(raw_transformations.attrib["vflip"])),
-        rotate=bool(int(raw_transformations.attrib["rotate"])),
-        prefer_untransformed=bool(
-            int(raw_transformations.attrib["preferuntransformed"])
-        ),
+        hflip=bool(int(attrib["hflip"])),
+        vflip=bool(int(attrib["vflip"])),
+        rotate=bool(int(attrib["rotate"])),
+        prefer_untransformed=bool(int(attrib["preferuntransformed"])),
     )
 
 
@@ -73,55 +75,61 @@ def _parse_tile(raw_tile: etree.Element, external_path: Optional[Path] = None) -
         Tile: The Tile created from the raw_tile
     """
 
-    tile = Tile(id=int(raw_tile.attrib["id"]))
-
-    if raw_tile.attrib.get("type") is not None:
-        tile.class_ = raw_tile.attrib["type"]
-
-    if raw_tile.attrib.get("class") is not None:
-        tile.class_ = raw_tile.attrib["class"]
-
-    animation_element = raw_tile.find("./animation")
-    if animation_element is not None:
-        tile.animation = []
-        for raw_frame in animation_element.findall("./frame"):
-            tile.animation.append(_parse_frame(raw_frame))
-
-    object_element = raw_tile.find("./objectgroup")
-    if object_element is not None:
-        tile.objects = parse_layer(object_element)
-
-    properties_element = raw_tile.find("./properties")
-    if properties_element is not None:
-        tile.properties = parse_properties(properties_element)
-
-    image_element = raw_tile.find("./image")
-    if image_element is not None:
-        if external_path:
-            tile.image = (
-                Path(external_path / image_element.attrib["source"])
-                .absolute()
-                .resolve()
-            )
-        else:
-            tile.image = Path(image_element.attrib["source"])
-
-        tile.image_width = int(image_element.attrib["width"])
-        tile.width = tile.image_width
-        tile.image_height = int(image_element.attrib["height"])
-        tile.height = tile.image_height
-
-    if raw_tile.attrib.get("x") is not None:
-        tile.x = int(raw_tile.attrib["x"])
-
-    if raw_tile.attrib.get("y") is not None:
-        tile.y = int(raw_tile.attrib["y"])
-
-    if raw_tile.attrib.get("width") is not None:
-        tile.width = int(raw_tile.attrib["width"])
-
-    if raw_tile.attrib.get("height") is not None:
-        tile.height = int(raw_tile.attrib["height"])
+    attrib = raw_tile.attrib
+
+    tile = Tile(id=int(attrib["id"]))
+
+    # Tile classes repeat across a tileset, so they are interned to share one string
+    # per distinct value rather than one per tile.
+    type_ = attrib.get("type")
+    if type_ is not None:
+        tile.class_ = sys.intern(type_)
+
+    class_ = attrib.get("class")
+    if class_ is not None:
+        tile.class_ = sys.intern(class_)
+
+    # Tilesets can contain thousands of tiles, so the children of each tile are
+    # visited in a single pass rather than searching for each kind of child in turn.
+    for child in raw_tile:
+        tag = child.tag
+        if tag == "animation":
+            tile.animation = [
+                _parse_frame(raw_frame) for raw_frame in child.iterfind("frame")
+            ]
+        elif tag == "objectgroup":
+            tile.objects = parse_layer(child)
+        elif tag == "properties":
+            tile.properties = parse_properties(child)
+        elif tag == "image":
+            image_attrib = child.attrib
+            if external_path:
+                tile.image = (
+                    Path(external_path / image_attrib["source"]).absolute().resolve()
+                )
+            else:
+                tile.image = Path(image_attrib["source"])
+
+            tile.image_width = int(image_attrib["width"])
+            tile.width = tile.image_width
+            tile.image_height = int(image_attrib["height"])
+            tile.height = tile.image_height
+
+    x = attrib.get("x")
+    if x is not None:
+        tile.x = int(x)
+
+    y = attrib.get("y")
+    if y is not None:
+        tile.y = int(y)
+
+    width = attrib.get("width")
+    if width is not None:
+        tile.width = int(width)
+
+    height = attrib.get("height")
+    if height is not None:
+        tile.height = int(height)
 
     return tile
 
@@ -131,92 +139,103 @@ def parse(
     firstgid: int,
     external_path: Optional[Path] = None,
 ) -> Tileset:
+    attrib = raw_tileset.attrib
+    find = raw_tileset.find
+
     tileset = Tileset(
-        name=raw_tileset.attrib["name"],
-        tile_count=int(raw_tileset.attrib["tilecount"]),
-        tile_width=int(raw_tileset.attrib["tilewidth"]),
-        tile_height=int(raw_tileset.attrib["tileheight"]),
-        columns=int(raw_tileset.attrib["columns"]),
+        name=attrib["name"],
+        tile_count=int(attrib["tilecount"]),
+        tile_width=int(attrib["tilewidth"]),
+        tile_height=int(attrib["tileheight"]),
+        columns=int(attrib["columns"]),
         firstgid=firstgid,
     )
 
-    if raw_tileset.attrib.get("version") is not None:
-        tileset.version = raw_tileset.attrib["version"]
+    version = attrib.get("version")
+    if version is not None:
+        tileset.version = version
 
-    if raw_tileset.attrib.get("tiledversion") is not None:
-        tileset.tiled_version = raw_tileset.attrib["tiledversion"]
+    tiled_version = attrib.get("tiledversion")
+    if tiled_version is not None:
+        tileset.tiled_version = tiled_version
 
-    if raw_tileset.attrib.get("backgroundcolor") is not None:
-        tileset.background_color = parse_color(raw_tileset.attrib["backgroundcolor"])
+    background_color = attrib.get("backgroundcolor")
+    if background_color is not None:
+        tileset.background_color = parse_color(background_color)
 
-    if raw_tileset.attrib.get("spacing") is not None:
-        tileset.spacing = int(raw_tileset.attrib["spacing"])
+    spacing = attrib.get("spacing")
+    if spacing is not None:
+        tileset.spacing = int(spacing)
 
-    if raw_tileset.attrib.get("margin") is not None:
-        tileset.margin = int(raw_tileset.attrib["margin"])
+    margin = attrib.get("margin")
+    if margin is not None:
+        tileset.margin = int(margin)
 
-    if raw_tileset.attrib.get("objectalignment") is not None:
-        tileset.alignment = raw_tileset.attrib["objectalignment"]
+    alignment = attrib.get("objectalignment")
+    if alignment is not None:
+        tileset.alignment = alignment
 
-    if raw_tileset.attrib.get("class") is not None:
-        tileset.class_ = raw_tileset.attrib["class"]
+    class_ = attrib.get("class")
+    if class_ is not None:
+        tileset.class_ = class_
 
-    if raw_tileset.attrib.get("fillmode") is not None:
-        tileset.fill_mode = raw_tileset.attrib["fillmode"]
+    fill_mode = attrib.get("fillmode")
+    if fill_mode is not None:
+        tileset.fill_mode = fill_mode
 
-    if raw_tileset.attrib.get("tilerendersize") is not None:
-        tileset.tile_render_size = raw_tileset.attrib["tilerendersize"]
+    tile_render_size = attrib.get("tilerendersize")
+    if tile_render_size is not None:
+        tileset.tile_render_size = tile_render_size
 
-    image_element = raw_tileset.find("image")
+    image_element = find("image")
     if image_element is not None:
+        image_attrib = image_element.attrib
         if external_path:
             tileset.image = (
-                Path(external_path / image_element.attrib["source"])
-                .absolute()
-                .resolve()
+                Path(external_path / image_attrib["source"]).absolute().resolve()
             )
         else:
-            tileset.image = Path(image_element.attrib["source"])
+            tileset.image = Path(image_attrib["source"])
 
-        tileset.image_width = int(image_element.attrib["width"])
-        tileset.image_height = int(image_element.attrib["height"])
+        tileset.image_width = int(image_attrib["width"])
+        tileset.image_height = int(image_attrib["height"])
 
-        if image_element.attrib.get("trans") is not None:
-            my_string = image_element.attrib["trans"]
-            if my_string[0] != "#":
-                my_string = f"#{my_string}"
-            tileset.transparent_color = parse_color(my_string)
+        trans = image_attrib.get("trans")
+        if trans is not None:
+            if trans[0] != "#":
+                trans = f"#{trans}"
+            tileset.transparent_color = parse_color(trans)
 
-    tileoffset_element = raw_tileset.find("./tileoffset")
+    tileoffset_element = find("tileoffset")
     if tileoffset_element is not None:
+        tileoffset_attrib = tileoffset_element.attrib
         tileset.tile_offset = OrderedPair(
-            int(tileoffset_element.attrib["x"]), int(tileoffset_element.attrib["y"])
+            int(tileoffset_attrib["x"]), int(tileoffset_attrib["y"])
         )
 
-    grid_element = raw_tileset.find("./grid")
+    grid_element = find("grid")
     if grid_element is not None:
         tileset.grid = _parse_grid(grid_element)
 
-    properties_element = raw_tileset.find("./properties")
+    properties_element = find("properties")
     if properties_element is not None:
         tileset.properties = parse_properties(properties_element)
 
     tiles = {}
-    for tile_element in raw_tileset.findall("./tile"):
-        tiles[int(tile_element.attrib["id"])] = _parse_tile(
-            tile_element, external_path=external_path
-        )
+    for tile_element in raw_tileset.iterfind("tile"):
+        tile = _parse_tile(tile_element, external_path=external_path)
+        tiles[tile.id] = tile
     if tiles:
         tileset.tiles = tiles
 
-    wangsets_element = raw_tileset.find("./wangsets")
+    wangsets_element = find("wangsets")
     if wangsets_element is not None:
         wangsets = []
-        for raw_wangset in wangsets_element.findall("./wangset"):
+        for raw_wangset in wangsets_element.iterfind("wangset"):
             wangsets.append(parse_wangset(raw_wangset))
         tileset.wang_sets = wangsets
 
-    transformations_element = raw_tileset.find("./transformations")
+    transformations_element = find("transformations")
     if transformations_element is not None:
         tileset.transformations = _parse_transformations(transformations_element)
 
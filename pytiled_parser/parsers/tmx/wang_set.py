@@ -14,8 +14,10 @@ def _parse_wang_tile(raw_wang_tile: etree.Element) -> WangTile:
     Returns:
         WangTile: A properly typed WangTile.
     """
-    ids = [int(v.strip()) for v in raw_wang_tile.attrib["wangid"].split(",")]
-    return WangTile(tile_id=int(raw_wang_tile.attrib["tileid"]), wang_id=ids)
+    attrib = raw_wang_tile.attrib
+    # int() already ignores surrounding whitespace, so the values don't need stripping
+    ids = list(map(int, attrib["wangid"].split(",")))
+    return WangTile(tile_id=int(attrib["tileid"]), wang_id=ids)
 
 
 def _parse_wang_color(raw_wang_color: etree.Element) -> WangColor:
@@ -27,18 +29,21 @@ def _parse_wang_color(raw_wang_color: etree.Element) -> WangColor:
     Returns:
         WangColor: A properly typed WangColor.
     """
+    attrib = raw_wang_color.attrib
+
     wang_color = WangColor(
-        name=raw_wang_color.attrib["name"],
-        color=parse_color(raw_wang_color.attrib["color"]),
-        tile=int(raw_wang_color.attrib["tile"]),
-        probability=float(raw_wang_color.attrib["probability"]),
+        name=attrib["name"],
+        color=parse_color(attrib["color"]),
+        tile=int(attrib["tile"]),
+        probability=float(attrib["probability"]),
     )
 
-    if raw_wang_color.attrib.get("class") is not None:
-        wang_color.class_ = raw_wang_color.attrib["class"]
+    class_ = attrib.get("class")
+    if class_ is not None:
+        wang_color.class_ = class_
 
-    properties = raw_wang_color.find("./properties")
-    if properties:
+    properties = raw_wang_color.find("properties")
+    if properties is not None:
         wang_color.properties = parse_properties(properties)
 
     return wang_color
@@ -55,26 +60,30 @@ def parse(raw_wangset: etree.Element) -> WangSet:
     """
 
     colors = []
-    for raw_wang_color in raw_wangset.findall("./wangcolor"):
+    for raw_wang_color in raw_wangset.iterfind("wangcolor"):
         colors.append(_parse_wang_color(raw_wang_color))
 
     tiles = {}
-    for raw_wang_tile in raw_wangset.findall("./wangtile"):
-        tiles[int(raw_wang_tile.attrib["tileid"])] = _parse_wang_tile(raw_wang_tile)
+    for raw_wang_tile in raw_wangset.iterfind("wangtile"):
+        wang_tile = _parse_wang_tile(raw_wang_tile)
+        tiles[wang_tile.tile_id] = wang_tile
+
+    attrib = raw_wangset.attrib
 
     wangset = WangSet(
-        name=raw_wangset.attrib["name"],
-        tile=int(raw_wangset.attrib["tile"]),
-        wang_type=raw_wangset.attrib["type"],
+        name=attrib["name"],
+        tile=int(attrib["tile"]),
+        wang_type=attrib["type"],
         wang_colors=colors,
         wang_tiles=tiles,
     )
 
-    if raw_wangset.attrib.get("class") is not None:
-        wangset.class_ = raw_wangset.attrib["class"]
+    class_ = attrib.get("class")
+    if class_ is not None:
+        wangset.class_ = class_
 
-    properties = raw_wangset.find("./properties")
-    if properties:
+    properties = raw_wangset.find("properties")
+    if properties is not None:
         wangset.properties = parse_properties(properties)
 
     return wangset
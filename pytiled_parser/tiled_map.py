@@ -76,3 +76,36 @@ class TiledMap:
     hex_side_length: Optional[int] = None
     stagger_axis: Optional[str] = None
     stagger_index: Optional[str] = None
+
+
+@attr.s(auto_attribs=True)
+class MapHeader:
+    """The basic attributes of a Tiled map, read without parsing any of its contents.
+
+    This is what is returned by `parse_map_header`, which is much cheaper than a full
+    `parse_map` when only a few details of many maps are needed up front, such as when
+    building a level select menu. None of the tilesets or layers are loaded.
+
+    Attributes:
+        map_file: The file the map was read from.
+        infinite: If the map is infinite or not.
+        map_size: The map width in tiles.
+        orientation: Map orientation. Tiled supports "orthogonal", "isometric",
+            "staggered" and "hexagonal"
+        render_order: The order in which tiles on tile layers are rendered.
+        tile_size: The size of a tile.
+        class_: The Tiled class of this Map.
+        background_color: The background color of the map.
+        properties: The properties of the Map.
+    """
+
+    map_file: Path
+    infinite: bool
+    map_size: Size
+    orientation: str
+    render_order: str
+    tile_size: Size
+
+    class_: Optional[str] = None
+    background_color: Optional[Color] = None
+    properties: Optional[Properties] = None
@@ -85,7 +85,7 @@ class Transformations:
     prefer_untransformed: bool = False
 
 
-@attr.s(auto_attribs=True, kw_only=True)
+@attr.s(auto_attribs=True, kw_only=True, slots=True)
 class Tile:
     """Individual tile object.
 
@@ -1,12 +1,44 @@
 """Utility Functions for PyTiled"""
+import functools
+import importlib.util
 import json
+import os
 import xml.etree.ElementTree as etree
 from pathlib import Path
 from typing import Any
 
-from pytiled_parser.common_types import Color
-
-
+from pytiled_parser.common_types import Color, OrderedPair, Size
+
+# lxml is an optional dependency which provides a much faster XML parser than the
+# standard library. The TMX parsers only make use of the subset of the ElementTree
+# API which lxml also implements, so when it is installed we use it to read TMX, TSX,
+# and TX files, otherwise we fall back to xml.etree.ElementTree.
+#
+# Either backend can be forced by setting the PYTILED_PARSER_XML_BACKEND environment
+# variable to "lxml" or "etree", which is mostly useful for comparing the two.
+#
+# CI runs the test suite twice, once without lxml installed, which is the run that
+# coverage is collected from, and once more with lxml installed. The branch that
+# imports lxml is exercised by that second run, but as it never runs in the one
+# being measured it is excluded from coverage.
+xml_backend_name = os.environ.get("PYTILED_PARSER_XML_BACKEND")
+if xml_backend_name is None:
+    xml_backend_name = "lxml" if importlib.util.find_spec("lxml") else "etree"
+
+if xml_backend_name == "lxml":  # pragma: no cover
+    from lxml import etree as xml_backend
+elif xml_backend_name == "etree":
+    xml_backend = etree  # type: ignore
+else:
+    raise ValueError(
+        f"Unknown XML backend {xml_backend_name!r} in PYTILED_PARSER_XML_BACKEND, "
+        "expected 'lxml' or 'etree'"
+    )
+
+
+# A map usually only uses a handful of distinct colors, and Color is immutable, so
+# repeated color strings are converted once and the result reused.
+@functools.lru_cache(maxsize=1024)
 def parse_color(color: str) -> Color:
     """Convert Tiled color format into PyTiled's.
 
@@ -36,6 +68,55 @@ def parse_color(color: str) -> Color:
     raise ValueError("Improperly formatted color passed to parse_color")
 
 
+# OrderedPair and Size are immutable, and the same values come up over and over in a
+# map (object sizes, chunk sizes, layer offsets and parallax factors), so the parsers
+# create them through these caches to share a single instance for each value.
+# typed=True keeps int and float values from sharing an entry, as 1 == 1.0.
+@functools.lru_cache(maxsize=4096, typed=True)
+def cached_ordered_pair(x: float, y: float) -> OrderedPair:
+    """Get an OrderedPair, reusing an existing instance for the same values.
+
+    Args:
+        x: The x value.
+        y: The y value.
+
+    Returns:
+        OrderedPair: The OrderedPair for the given values.
+    """
+    return OrderedPair(x, y)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def cached_size(width: float, height: float) -> Size:
+    """Get a Size, reusing an existing instance for the same values.
+
+    Args:
+        width: The width value.
+        height: The height value.
+
+    Returns:
+        Size: The Size for the given values.
+    """
+    return Size(width, height)
+
+
+def load_xml(file_path: Path) -> etree.Element:
+    """Parse an XML file and return its root element.
+
+    This uses lxml if it is installed, otherwise it uses xml.etree.ElementTree.
+
+    Args:
+        file_path: Path to the TMX, TSX, or TX file to parse.
+
+    Returns:
+        etree.Element: The root element of the file.
+    """
+    # Reading the whole file in one call and parsing it from memory is faster than
+    # letting the parser pull it in through many small buffered reads.
+    with open(file_path, "rb") as xml_file:
+        return xml_backend.fromstring(xml_file.read())
+
+
 def check_format(file_path: Path) -> str:
     with open(file_path) as file:
         line = file.readline().rstrip().strip()
@@ -52,14 +133,13 @@ def load_object_template(file_path: Path) -> Any:
     new_tileset_path = None
 
     if template_format == "tmx":
-        with open(file_path) as template_file:
-            template = etree.parse(template_file).getroot()
+        template = load_xml(file_path)
 
-            tileset_element = template.find("./tileset")
-            if tileset_element is not None:
-                tileset_path = Path(file_path.parent / tileset_element.attrib["source"])
-                new_tileset = load_object_tileset(tileset_path)
-                new_tileset_path = tileset_path.parent
+        tileset_element = template.find("tileset")
+        if tileset_element is not None:
+            tileset_path = Path(file_path.parent / tileset_element.attrib["source"])
+            new_tileset = load_object_tileset(tileset_path)
+            new_tileset_path = tileset_path.parent
     else:
         with open(file_path) as template_file:
             template = json.load(template_file)
@@ -76,10 +156,10 @@ def load_object_tileset(file_path: Path) -> Any:
 
     new_tileset = None
 
-    with open(file_path) as tileset_file:
-        if tileset_format == "tmx":
-            new_tileset = etree.parse(tileset_file).getroot()
-        else:
+    if tileset_format == "tmx":
+        new_tileset = load_xml(file_path)
+    else:
+        with open(file_path) as tileset_file:
             new_tileset = json.load(tileset_file)
 
     return new_tileset
@@ -123,15 +123,14 @@ def parse_world(file: Path) -> World:
             maps.append(_parse_world_map(raw_map, map_path))
 
     if raw_world.get("patterns"):
+        # The directory listing is the same for every pattern, so only read it once
+        dir_files = [f for f in listdir(parent_dir) if isfile(join(parent_dir, f))]
         for raw_pattern in raw_world["patterns"]:
             regex = re.compile(raw_pattern["regexp"])
-            map_files = [
-                f
-                for f in listdir(parent_dir)
-                if isfile(join(parent_dir, f)) and regex.match(f)
-            ]
-            for map_file in map_files:
-                search = regex.search(map_file)
+            for map_file in dir_files:
+                # The match is reused for the coordinates rather than running the
+                # pattern a second time with search()
+                search = regex.match(map_file)
                 if search:
                     width = raw_pattern["multiplierX"]
                     height = raw_pattern["multiplierY"]
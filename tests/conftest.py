@@ -0,0 +1,27 @@
+"""Fixtures shared between the test modules"""
+import importlib.util
+
+import pytest
+
+
+@pytest.fixture
+def load_expected():
+    """Load the EXPECTED value from the expected.py of a test data directory.
+
+    The module is executed again on every call, so each test gets its own copy of
+    EXPECTED which it is free to modify before comparing against it. Re-running the
+    module's cached bytecode costs about the same as deep copying a loaded copy, so
+    nothing is cached between tests.
+    """
+
+    def _load_expected(test_dir):
+        # it's a PITA to import like this, don't do it
+        # https://stackoverflow.com/a/67692/1342874
+        spec = importlib.util.spec_from_file_location(
+            "expected", test_dir / "expected.py"
+        )
+        expected = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(expected)
+        return expected.EXPECTED
+
+    return _load_expected
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+from pytiled_parser import common_types, layer, tiled_object
+
+EXPECTED = [
+    layer.LayerGroup(
+        name="Group 1",
+        opacity=1,
+        visible=True,
+        id=1,
+        layers=[
+            layer.ObjectLayer(
+                name="Object Layer 1",
+                opacity=1,
+                visible=True,
+                id=2,
+                draw_order="topdown",
+                tiled_objects=[
+                    tiled_object.Rectangle(
+                        id=1,
+                        name="",
+                        rotation=0,
+                        size=common_types.Size(3, 4),
+                        coordinates=common_types.OrderedPair(1, 2),
+                        visible=True,
+                        class_="",
+                    )
+                ],
+            ),
+            layer.TileLayer(
+                name="Tile Layer 1",
+                opacity=1,
+                visible=True,
+                id=3,
+                size=common_types.Size(2, 2),
+                data=[[1, 2], [3, 4]],
+            ),
+            layer.ImageLayer(
+                name="Image Layer 1",
+                opacity=1,
+                visible=True,
+                id=4,
+                image=Path("../../images/tile_04.png"),
+            ),
+            layer.ObjectLayer(
+                name="Object Layer 2",
+                opacity=1,
+                visible=True,
+                id=5,
+                draw_order="topdown",
+                tiled_objects=[
+                    tiled_object.Rectangle(
+                        id=2,
+                        name="",
+                        rotation=0,
+                        size=common_types.Size(7, 8),
+                        coordinates=common_types.OrderedPair(5, 6),
+                        visible=True,
+                        class_="",
+                    )
+                ],
+            ),
+            layer.TileLayer(
+                name="Tile Layer 2",
+                opacity=1,
+                visible=True,
+                id=6,
+                size=common_types.Size(2, 2),
+                data=[[4, 3], [2, 1]],
+            ),
+        ],
+    ),
+]
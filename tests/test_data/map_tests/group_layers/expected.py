@@ -0,0 +1,105 @@
+from pathlib import Path
+
+from pytiled_parser import common_types, layer, tiled_map, tiled_object, tileset
+
+EXPECTED = tiled_map.TiledMap(
+    map_file=None,
+    infinite=False,
+    layers=[
+        layer.TileLayer(
+            name="Tile Layer 1",
+            opacity=1,
+            visible=True,
+            id=1,
+            size=common_types.Size(4, 2),
+            data=[[1, 2, 3, 4], [5, 6, 7, 8]],
+        ),
+        layer.LayerGroup(
+            name="Group 1",
+            opacity=1,
+            visible=True,
+            id=2,
+            layers=[
+                layer.TileLayer(
+                    name="Tile Layer 2",
+                    opacity=1,
+                    visible=True,
+                    id=3,
+                    size=common_types.Size(4, 2),
+                    data=[[8, 7, 6, 5], [4, 3, 2, 1]],
+                ),
+                layer.LayerGroup(
+                    name="Group 2",
+                    opacity=1,
+                    visible=True,
+                    id=4,
+                    layers=[
+                        layer.ObjectLayer(
+                            name="Object Layer 1",
+                            opacity=1,
+                            visible=True,
+                            id=5,
+                            draw_order="topdown",
+                            tiled_objects=[
+                                tiled_object.Rectangle(
+                                    id=2,
+                                    name="",
+                                    rotation=0,
+                                    size=common_types.Size(30, 40),
+                                    coordinates=common_types.OrderedPair(10, 20),
+                                    visible=True,
+                                    class_="",
+                                )
+                            ],
+                        ),
+                    ],
+                ),
+            ],
+        ),
+    ],
+    map_size=common_types.Size(4, 2),
+    next_layer_id=6,
+    next_object_id=3,
+    orientation="orthogonal",
+    render_order="right-down",
+    tiled_version="1.9.1",
+    tile_size=common_types.Size(32, 32),
+    version="1.9",
+    tilesets={
+        1: tileset.Tileset(
+            columns=8,
+            image=Path("../../images/tmw_desert_spacing.png"),
+            image_width=265,
+            image_height=199,
+            margin=1,
+            spacing=1,
+            firstgid=1,
+            name="tileset",
+            tile_count=48,
+            tile_height=32,
+            tile_width=32,
+            tiles={
+                0: tileset.Tile(
+                    id=0,
+                    objects=layer.ObjectLayer(
+                        name="",
+                        opacity=1,
+                        visible=True,
+                        draw_order="index",
+                        tiled_objects=[
+                            tiled_object.Rectangle(
+                                id=1,
+                                name="",
+                                rotation=0,
+                                size=common_types.Size(16, 12),
+                                coordinates=common_types.OrderedPair(4, 8),
+                                visible=True,
+                                class_="",
+                            )
+                        ],
+                    ),
+                )
+            },
+        )
+    },
+)
@@ -2,22 +2,20 @@ from pathlib import Path
 
 from pytiled_parser import common_types, world
 
+WORLD_DIR = Path(__file__).parent.absolute().resolve()
+
 EXPECTED = world.World(
     only_show_adjacent=False,
     maps=[
         world.WorldMap(
             size=common_types.Size(160, 160),
             coordinates=common_types.OrderedPair(0.0, 0.0),
-            map_file=Path(Path(__file__).parent / "map_p0-n0.json")
-            .absolute()
-            .resolve(),
+            map_file=WORLD_DIR / "map_p0-n0.json",
         ),
         world.WorldMap(
             size=common_types.Size(160, 160),
             coordinates=common_types.OrderedPair(0.0, 160.0),
-            map_file=Path(Path(__file__).parent / "map_p0-n1.json")
-            .absolute()
-            .resolve(),
+            map_file=WORLD_DIR / "map_p0-n1.json",
         ),
     ],
 )
@@ -1,15 +1,20 @@
 """Tests for tilesets"""
-import importlib.util
+import base64
+import gzip
 import json
 import os
+import struct
 import xml.etree.ElementTree as etree
 from pathlib import Path
 
 import pytest
 
 from pytiled_parser.common_types import OrderedPair, Size
+from pytiled_parser.layer import LayerGroup, ObjectLayer
 from pytiled_parser.parsers.json.layer import parse as parse_json
 from pytiled_parser.parsers.tmx.layer import parse as parse_tmx
+from pytiled_parser.parsers.tmx.tiled_map import LAYER_TAGS
+from pytiled_parser.util import load_xml
 
 TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 TEST_DATA = TESTS_DIR / "test_data"
@@ -24,6 +29,7 @@ ALL_LAYER_TESTS = [
     LAYER_TESTS / "no_layers",
     LAYER_TESTS / "infinite_map",
     LAYER_TESTS / "infinite_map_b64",
+    LAYER_TESTS / "group_order",
 ]
 
 ZSTD_LAYER_TEST = LAYER_TESTS / "b64_zstd"
@@ -49,24 +55,18 @@ def fix_layer(layer):
         round(layer.parallax_factor[0], 4),
         round(layer.parallax_factor[1], 4),
     )
-    if hasattr(layer, "tiled_objects"):
+    if isinstance(layer, ObjectLayer):
         for tiled_object in layer.tiled_objects:
             fix_object(tiled_object)
-    if hasattr(layer, "layers"):
+    elif isinstance(layer, LayerGroup):
         for child_layer in layer.layers:
             fix_layer(child_layer)
 
 
 @pytest.mark.parametrize("parser_type", ["json", "tmx"])
 @pytest.mark.parametrize("layer_test", ALL_LAYER_TESTS)
-def test_layer_integration(parser_type, layer_test):
-    # it's a PITA to import like this, don't do it
-    # https://stackoverflow.com/a/67692/1342874
-    spec = importlib.util.spec_from_file_location(
-        "expected", layer_test / "expected.py"
-    )
-    expected = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(expected)
+def test_layer_integration(parser_type, layer_test, load_expected):
+    expected_layers = load_expected(layer_test)
 
     if parser_type == "json":
         raw_layers_path = layer_test / "map.json"
@@ -75,29 +75,17 @@ def test_layer_integration(parser_type, layer_test):
             layers = [parse_json(raw_layer) for raw_layer in raw_layers]
     elif parser_type == "tmx":
         raw_layers_path = layer_test / "map.tmx"
-        with open(raw_layers_path) as raw_layers_file:
-            raw_layer = etree.parse(raw_layers_file).getroot()
-            layers = []
-            for layer in raw_layer.findall("./layer"):
-                layers.append(parse_tmx(layer))
-
-            for layer in raw_layer.findall("./objectgroup"):
-                layers.append(parse_tmx(layer))
-
-            for layer in raw_layer.findall("./group"):
-                layers.append(parse_tmx(layer))
-
-            for layer in raw_layer.findall("./imagelayer"):
-                layers.append(parse_tmx(layer))
+        raw_map = load_xml(raw_layers_path)
+        layers = [parse_tmx(child) for child in raw_map if child.tag in LAYER_TAGS]
 
     for layer in layers:
         fix_layer(layer)
 
-    for layer in expected.EXPECTED:
+    for layer in expected_layers:
         fix_layer(layer)
         print(layer.size)
 
-    assert layers == expected.EXPECTED
+    assert layers == expected_layers
 
 @pytest.mark.parametrize("parser_type", ["json", "tmx"])
 def test_zstd_not_installed(parser_type):
@@ -106,24 +94,12 @@ def test_zstd_not_installed(parser_type):
         with open(raw_layers_path) as raw_layers_file:
             raw_layers = json.load(raw_layers_file)["layers"]
             with pytest.raises(ValueError):
-                layers = [parse_json(raw_layer) for raw_layer in raw_layers]
+                [parse_json(raw_layer) for raw_layer in raw_layers]
     elif parser_type == "tmx":
         raw_layers_path = ZSTD_LAYER_TEST / "map.tmx"
-        with open(raw_layers_path) as raw_layers_file:
-            with pytest.raises(ValueError):
-                raw_layer = etree.parse(raw_layers_file).getroot()
-                layers = []
-                for layer in raw_layer.findall("./layer"):
-                    layers.append(parse_tmx(layer))
-
-                for layer in raw_layer.findall("./objectgroup"):
-                    layers.append(parse_tmx(layer))
-
-                for layer in raw_layer.findall("./group"):
-                    layers.append(parse_tmx(layer))
-
-                for layer in raw_layer.findall("./imagelayer"):
-                    layers.append(parse_tmx(layer))
+        raw_map = load_xml(raw_layers_path)
+        with pytest.raises(ValueError):
+            [parse_tmx(child) for child in raw_map if child.tag in LAYER_TAGS]
 
 def test_unknown_layer_type():
     # We only test JSON here because due to the nature of the TMX format
@@ -136,3 +112,56 @@ def test_unknown_layer_type():
         raw_layers = json.load(raw_layers_file)["layers"]
         with pytest.raises(RuntimeError):
             layers = [parse_json(raw_layer) for raw_layer in raw_layers]
+
+
+def parse_tile_layer_data(parser_type, data, encoding, compression=""):
+    """Parse a 2x2 tile layer with the given data and return its decoded tiles."""
+    if parser_type == "json":
+        raw_layer = {
+            "type": "tilelayer",
+            "name": "Tile Layer 1",
+            "opacity": 1,
+            "visible": True,
+            "width": 2,
+            "height": 2,
+            "data": data,
+        }
+        if encoding != "csv":
+            raw_layer["encoding"] = encoding
+            raw_layer["compression"] = compression
+        return parse_json(raw_layer).data
+
+    compression_attribute = f' compression="{compression}"' if compression else ""
+    raw_layer = etree.fromstring(
+        '<layer id="1" name="Tile Layer 1" width="2" height="2">'
+        f'<data encoding="{encoding}"{compression_attribute}>{data}</data>'
+        "</layer>"
+    )
+    return parse_tmx(raw_layer).data
+
+
+@pytest.mark.parametrize("parser_type", ["json", "tmx"])
+def test_multi_member_gzip_data(parser_type):
+    data = base64.b64encode(
+        gzip.compress(struct.pack("<2I", 1, 2))
+        + gzip.compress(struct.pack("<2I", 3, 4))
+    ).decode()
+
+    assert parse_tile_layer_data(parser_type, data, "base64", "gzip") == [
+        [1, 2],
+        [3, 4],
+    ]
+
+
+def test_csv_data_trailing_comma():
+    assert parse_tile_layer_data("tmx", "\n1,2,\n3,4,\n", "csv") == [[1, 2], [3, 4]]
+
+
+def test_csv_data_empty():
+    assert parse_tile_layer_data("tmx", "\n", "csv") == [[]]
+
+
+@pytest.mark.parametrize("data", ["1.5,2,3,4", "1e3,2,3,4", "NaN,2,3,4", "true,2,3,4"])
+def test_csv_data_not_integers(data):
+    with pytest.raises(ValueError):
+        parse_tile_layer_data("tmx", data, "csv")
@@ -1,11 +1,15 @@
 """Tests for maps"""
-import importlib.util
+import base64
+import gzip
 import os
+import shutil
+import struct
+import zlib
 from pathlib import Path
 
 import pytest
 
-from pytiled_parser import UnknownFormat, parse_map
+from pytiled_parser import MapHeader, UnknownFormat, parse_map, parse_map_header
 from pytiled_parser.common_types import OrderedPair, Size
 
 TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
@@ -20,6 +24,7 @@ ALL_MAP_TESTS = [
     MAP_TESTS / "embedded_tileset",
     MAP_TESTS / "template",
     MAP_TESTS / "cross_format_tileset",
+    MAP_TESTS / "group_layers",
 ]
 
 JSON_INVALID_TILESET = MAP_TESTS / "json_invalid_tileset"
@@ -59,12 +64,8 @@ def fix_map(map):
 
 @pytest.mark.parametrize("parser_type", ["json", "tmx"])
 @pytest.mark.parametrize("map_test", ALL_MAP_TESTS)
-def test_map_integration(parser_type, map_test):
-    # it's a PITA to import like this, don't do it
-    # https://stackoverflow.com/a/67692/1342874
-    spec = importlib.util.spec_from_file_location("expected", map_test / "expected.py")
-    expected = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(expected)
+def test_map_integration(parser_type, map_test, load_expected):
+    expected_map = load_expected(map_test)
 
     if parser_type == "json":
         raw_maps_path = map_test / "map.json"
@@ -74,7 +75,7 @@ def test_map_integration(parser_type, map_test):
     casted_map = parse_map(raw_maps_path)
 
     # file detection when running from unit tests is broken
-    expected.EXPECTED.map_file = casted_map.map_file
+    expected_map.map_file = casted_map.map_file
 
     # who even knows what/how/when the gods determine what the
     # version values in maps/tileset files are, so we're just not
@@ -86,12 +87,123 @@ def test_map_integration(parser_type, map_test):
     #
     # This also adjusts the map_file parameter since that can't be known
     # in a way that is valid for the tests.
-    fix_map(expected.EXPECTED)
+    fix_map(expected_map)
     fix_map(casted_map)
-    assert casted_map == expected.EXPECTED
+    assert casted_map == expected_map
 
-def test_json_invalid_tileset():
-    raw_map_path = JSON_INVALID_TILESET / "map.json"
+@pytest.mark.parametrize("parser_type", ["json", "tmx"])
+@pytest.mark.parametrize("map_test", ALL_MAP_TESTS)
+def test_map_header(parser_type, map_test, load_expected):
+    expected_map = load_expected(map_test)
+    raw_map_path = map_test / f"map.{parser_type}"
+
+    expected_header = MapHeader(
+        map_file=raw_map_path,
+        infinite=expected_map.infinite,
+        map_size=expected_map.map_size,
+        orientation=expected_map.orientation,
+        render_order=expected_map.render_order,
+        tile_size=expected_map.tile_size,
+        class_=expected_map.class_,
+        background_color=expected_map.background_color,
+        properties=expected_map.properties,
+    )
+
+    header = parse_map_header(raw_map_path)
+
+    assert header == expected_header
+
+
+def test_tmx_empty_properties(tmp_path):
+    map_path = tmp_path / "map.tmx"
+    map_path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<map version="1.9" tiledversion="1.9.1" orientation="orthogonal" '
+        'renderorder="right-down" width="1" height="1" tilewidth="32" '
+        'tileheight="32" infinite="0" nextlayerid="1" nextobjectid="1">\n'
+        " <properties/>\n"
+        "</map>\n"
+    )
+
+    assert parse_map(map_path).properties == {}
+    assert parse_map_header(map_path).properties == {}
+
+
+@pytest.mark.parametrize("parser_type", ["json", "tmx"])
+def test_json_invalid_tileset(parser_type):
+    raw_map_path = JSON_INVALID_TILESET / f"map.{parser_type}"
 
     with pytest.raises(UnknownFormat):
         parse_map(raw_map_path)
+
+
+def test_external_tileset_reloads_changed_file(tmp_path):
+    map_dir = tmp_path / "map"
+    shutil.copytree(MAP_TESTS / "external_tileset_dif_dir", map_dir)
+
+    assert parse_map(map_dir / "map.tmx").tilesets[1].name == "tileset"
+
+    tileset_path = map_dir / "tileset" / "tileset.tsx"
+    tileset_path.write_text(
+        tileset_path.read_text().replace('name="tileset"', 'name="edited_tileset"')
+    )
+
+    assert parse_map(map_dir / "map.tmx").tilesets[1].name == "edited_tileset"
+
+
+@pytest.mark.parametrize("parser_type", ["json", "tmx"])
+def test_external_tileset_not_shared_between_maps(parser_type):
+    raw_map_path = MAP_TESTS / "external_tileset_dif_dir" / f"map.{parser_type}"
+
+    first_map = parse_map(raw_map_path)
+    expected_tiles = dict(first_map.tilesets[1].tiles)
+    first_map.tilesets[1].tiles.clear()
+    first_map.tilesets[1].name = "edited_tileset"
+
+    second_map = parse_map(raw_map_path)
+    assert second_map.tilesets[1].name == "tileset"
+    assert second_map.tilesets[1].tiles == expected_tiles
+    assert second_map.tilesets[1] is not first_map.tilesets[1]
+
+
+LARGE_MAP_SIZE = 512
+
+
+@pytest.mark.parametrize(
+    "encoding,compression",
+    [("csv", ""), ("base64", ""), ("base64", "zlib"), ("base64", "gzip")],
+)
+def test_large_tile_layer(tmp_path, encoding, compression):
+    size = LARGE_MAP_SIZE
+    # the last tile is flipped horizontally to check the top bit survives decoding
+    gids = [index % 97 for index in range(size * size - 1)] + [0x80000001]
+
+    if encoding == "csv":
+        data = ",".join(map(str, gids))
+    else:
+        raw_data = struct.pack(f"<{len(gids)}I", *gids)
+        if compression == "zlib":
+            raw_data = zlib.compress(raw_data)
+        elif compression == "gzip":
+            raw_data = gzip.compress(raw_data)
+        data = base64.b64encode(raw_data).decode()
+
+    compression_attribute = f' compression="{compression}"' if compression else ""
+    map_path = tmp_path / "map.tmx"
+    map_path.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<map version="1.9" tiledversion="1.9.1" orientation="orthogonal" '
+        f'renderorder="right-down" width="{size}" height="{size}" tilewidth="32" '
+        f'tileheight="32" infinite="0" nextlayerid="2" nextobjectid="1">\n'
+        f' <layer id="1" name="Tile Layer 1" width="{size}" height="{size}">\n'
+        f'  <data encoding="{encoding}"{compression_attribute}>{data}</data>\n'
+        " </layer>\n"
+        "</map>\n"
+    )
+
+    layer_data = parse_map(map_path).layers[0].data
+
+    assert len(layer_data) == size
+    assert all(len(row) == size for row in layer_data)
+    assert layer_data[1][0] == size % 97
+    assert layer_data[-1][-1] == 0x80000001
@@ -8,11 +8,16 @@ def test_parse_color_wrong_format():
         color = parse_color("#ff0000ff0")
 
 
-def test_parse_color_no_hash():
-    color = parse_color("ff0000")
-    assert color == (255, 0, 0, 255)
-
-
-def test_parse_color_no_alpha():
-    color = parse_color("#ff0000")
-    assert color == (255, 0, 0, 255)
+@pytest.mark.parametrize(
+    "color_string,expected",
+    [
+        ("#ff0000", (255, 0, 0, 255)),
+        ("ff0000", (255, 0, 0, 255)),
+        ("#80ff0000", (255, 0, 0, 128)),
+        ("80ff0000", (255, 0, 0, 128)),
+    ],
+    ids=["no alpha", "no hash", "alpha", "alpha no hash"],
+)
+def test_parse_color(color_string, expected):
+    color = parse_color(color_string)
+    assert color == expected
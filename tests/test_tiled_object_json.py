@@ -1,6 +1,5 @@
 """Tests for objects"""
 import json
-from contextlib import ExitStack as does_not_raise
 from pathlib import Path
 
 import pytest
@@ -1107,7 +1106,11 @@ TEXTS = [
 OBJECTS = ELLIPSES + RECTANGLES + POINTS + TILES + POLYGONS + POLYLINES + TEXTS
 
 
-@pytest.mark.parametrize("raw_object_json,expected", OBJECTS)
+@pytest.mark.parametrize(
+    "raw_object_json,expected",
+    OBJECTS,
+    ids=[expected.name for _, expected in OBJECTS],
+)
 def test_parse_layer(raw_object_json, expected):
     raw_object = json.loads(raw_object_json)
     result = parse(raw_object)
@@ -1,6 +1,5 @@
 """Tests for objects"""
 import xml.etree.ElementTree as etree
-from contextlib import ExitStack as does_not_raise
 from pathlib import Path
 
 import pytest
@@ -484,7 +483,11 @@ TILES = [
 OBJECTS = ELLIPSES + RECTANGLES + POINTS + POLYGONS + POLYLINES + TEXTS + TILES
 
 
-@pytest.mark.parametrize("raw_object_tmx,expected", OBJECTS)
+@pytest.mark.parametrize(
+    "raw_object_tmx,expected",
+    OBJECTS,
+    ids=[expected.name for _, expected in OBJECTS],
+)
 def test_parse_layer(raw_object_tmx, expected):
     raw_object = etree.fromstring(raw_object_tmx)
     result = parse(raw_object)
@@ -1,16 +1,11 @@
 """Tests for tilesets"""
-import importlib.util
-import json
 import os
-import xml.etree.ElementTree as etree
 from pathlib import Path
 
 import pytest
 
-from pytiled_parser import parse_tileset
+from pytiled_parser import parse_map, parse_tileset
 from pytiled_parser.common_types import OrderedPair, Size
-from pytiled_parser.parsers.json.tileset import parse as parse_json
-from pytiled_parser.parsers.tmx.tileset import parse as parse_tmx
 
 TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 TEST_DATA = TESTS_DIR / "test_data"
@@ -49,14 +44,8 @@ def fix_tileset(tileset):
 
 @pytest.mark.parametrize("parser_type", ["json", "tmx"])
 @pytest.mark.parametrize("tileset_dir", ALL_TILESET_DIRS)
-def test_tilesets_integration(parser_type, tileset_dir):
-    # it's a PITA to import like this, don't do it
-    # https://stackoverflow.com/a/67692/1342874
-    spec = importlib.util.spec_from_file_location(
-        "expected", tileset_dir / "expected.py"
-    )
-    expected = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(expected)
+def test_tilesets_integration(parser_type, tileset_dir, load_expected):
+    expected_tileset = load_expected(tileset_dir)
 
     if parser_type == "json":
         raw_tileset_path = tileset_dir / "tileset.json"
@@ -65,16 +54,68 @@ def test_tilesets_integration(parser_type, tileset_dir):
 
     tileset_ = parse_tileset(raw_tileset_path)
 
-    # if parser_type == "json":
-    #     raw_tileset_path = tileset_dir / "tileset.json"
-    #     with open(raw_tileset_path) as raw_tileset:
-    #         tileset_ = parse_json(json.loads(raw_tileset.read()), 1)
-    # elif parser_type == "tmx":
-    #     raw_tileset_path = tileset_dir / "tileset.tsx"
-    #     with open(raw_tileset_path) as raw_tileset:
-    #         tileset_ = parse_tmx(etree.parse(raw_tileset).getroot(), 1)
-
     fix_tileset(tileset_)
-    fix_tileset(expected.EXPECTED)
+    fix_tileset(expected_tileset)
+
+    assert tileset_ == expected_tileset
 
-    assert tileset_ == expected.EXPECTED
+
+@pytest.mark.parametrize("parser_type", ["json", "tmx"])
+def test_tileset_image_path_follows_symlinks(parser_type, tmp_path):
+    images_dir = tmp_path / "assets" / "images"
+    images_dir.mkdir(parents=True)
+    tileset_dir = tmp_path / "tileset"
+    tileset_dir.mkdir()
+    try:
+        (tileset_dir / "link").symlink_to(images_dir, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks are not supported here")
+
+    # ".." is applied after following the link, so this is assets/tile.png
+    source = "link/../tile.png"
+    if parser_type == "json":
+        tileset_path = tileset_dir / "tileset.json"
+        tileset_path.write_text(
+            '{"name": "tileset", "tilecount": 1, "tilewidth": 32, "tileheight": 32, '
+            '"columns": 1, "spacing": 0, "margin": 0, '
+            f'"image": "{source}", "imagewidth": 32, "imageheight": 32, '
+            f'"tiles": [{{"id": 0, "image": "{source}", '
+            '"imagewidth": 32, "imageheight": 32}]}'
+        )
+    elif parser_type == "tmx":
+        tileset_path = tileset_dir / "tileset.tsx"
+        tileset_path.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<tileset name="tileset" tilewidth="32" tileheight="32" tilecount="1" '
+            'columns="1">\n'
+            f' <image source="{source}" width="32" height="32"/>\n'
+            ' <tile id="0">\n'
+            f'  <image source="{source}" width="32" height="32"/>\n'
+            " </tile>\n"
+            "</tileset>\n"
+        )
+
+    map_path = tmp_path / f"map.{parser_type}"
+    if parser_type == "json":
+        map_path.write_text(
+            '{"height": 1, "width": 1, "infinite": false, "layers": [], '
+            '"nextlayerid": 1, "nextobjectid": 1, "orientation": "orthogonal", '
+            '"renderorder": "right-down", "tiledversion": "1.9.1", "version": "1.9", '
+            '"tileheight": 32, "tilewidth": 32, '
+            '"tilesets": [{"firstgid": 1, "source": "tileset/tileset.json"}]}'
+        )
+    elif parser_type == "tmx":
+        map_path.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<map version="1.9" tiledversion="1.9.1" orientation="orthogonal" '
+            'renderorder="right-down" width="1" height="1" tilewidth="32" '
+            'tileheight="32" infinite="0" nextlayerid="1" nextobjectid="1">\n'
+            ' <tileset firstgid="1" source="tileset/tileset.tsx"/>\n'
+            "</map>\n"
+        )
+
+    tileset_ = parse_map(map_path).tilesets[1]
+
+    expected_image = (tmp_path / "assets" / "tile.png").resolve()
+    assert tileset_.image == expected_image
+    assert tileset_.tiles[0].image == expected_image
@@ -1,5 +1,4 @@
 """Tests for worlds"""
-import importlib.util
 import operator
 import os
 from pathlib import Path
@@ -24,14 +23,8 @@ def fix_world(world):
 
 
 @pytest.mark.parametrize("world_test", ALL_WORLD_TESTS)
-def test_world_integration(world_test):
-    # it's a PITA to import like this, don't do it
-    # https://stackoverflow.com/a/67692/1342874
-    spec = importlib.util.spec_from_file_location(
-        "expected", world_test / "expected.py"
-    )
-    expected = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(expected)
+def test_world_integration(world_test, load_expected):
+    expected_world = load_expected(world_test)
 
     raw_world_path = world_test / "world.world"
 
@@ -42,6 +35,6 @@ def test_world_integration(world_test):
     # and it can vary between runs, but pytest will fail if it is
     # not in the same order.
     fix_world(casted_world)
-    fix_world(expected.EXPECTED)
+    fix_world(expected_world)
 
-    assert casted_world == expected.EXPECTED
+    assert casted_world == expected_world
@@ -0,0 +1,56 @@
+"""Tests for choosing the XML backend with PYTILED_PARSER_XML_BACKEND"""
+import importlib
+import os
+import xml.etree.ElementTree as etree
+from pathlib import Path
+
+import pytest
+
+from pytiled_parser import util
+
+TESTS_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+MAP_FILE = TESTS_DIR / "test_data" / "map_tests" / "no_layers" / "map.tmx"
+
+BACKEND_VARIABLE = "PYTILED_PARSER_XML_BACKEND"
+
+
+@pytest.fixture
+def reload_util():
+    """Reload util with PYTILED_PARSER_XML_BACKEND set to the given value.
+
+    The environment and util are both put back the way they were afterwards.
+    """
+    original = os.environ.get(BACKEND_VARIABLE)
+
+    def _reload_util(backend):
+        os.environ[BACKEND_VARIABLE] = backend
+        return importlib.reload(util)
+
+    yield _reload_util
+
+    if original is None:
+        os.environ.pop(BACKEND_VARIABLE, None)
+    else:
+        os.environ[BACKEND_VARIABLE] = original
+    importlib.reload(util)
+
+
+def test_etree_backend(reload_util):
+    reloaded_util = reload_util("etree")
+
+    assert reloaded_util.xml_backend is etree
+    assert isinstance(reloaded_util.load_xml(MAP_FILE), etree.Element)
+
+
+def test_lxml_backend(reload_util):
+    lxml_etree = pytest.importorskip("lxml.etree")
+
+    reloaded_util = reload_util("lxml")
+
+    assert reloaded_util.xml_backend is lxml_etree
+    assert isinstance(reloaded_util.load_xml(MAP_FILE), lxml_etree._Element)
+
+
+def test_unknown_backend(reload_util):
+    with pytest.raises(ValueError):
+        reload_util("expat")